@@ -9,27 +9,22 @@ uv run examples/transaction/transaction_freeze_manually.py
 python examples/transaction/transaction_freeze_manually.py
 """
 
-import os
 import sys
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import (
     AccountId,
     Client,
+    PrecheckError,
     ResponseCode,
     TopicCreateTransaction,
     Transaction,
     TransactionId,
 )
+from hiero_sdk_python.exceptions import MaxAttemptsError
 
 
-load_dotenv()
-
-NETWORK_NAME = os.getenv("NETWORK", "testnet").lower()
-OPERATOR_ID = os.getenv("OPERATOR_ID")
-OPERATOR_KEY = os.getenv("OPERATOR_KEY")
-NODE_ACCOUNT_ID = AccountId.from_string("0.0.3")
+NODE_ACCOUNT_ID = AccountId(shard=0, realm=0, num=3)
+TOPIC_MEMO = "Test Topic Creation"
 
 
 def setup_client():
@@ -44,7 +39,7 @@ def build_unsigned_tx(executor_client):
     """Build a Transaction, manually freeze it for a specific node, and return serialized unsigned bytes."""
     tx_id = TransactionId.generate(executor_client.operator_account_id)
 
-    tx = TopicCreateTransaction().set_memo("Test Topic Creation").set_transaction_id(tx_id)
+    tx = TopicCreateTransaction().set_memo(TOPIC_MEMO).set_transaction_id(tx_id)
 
     # Explicit node binding (important for deterministic freeze)
     tx.node_account_id = NODE_ACCOUNT_ID
@@ -59,24 +54,25 @@ def build_unsigned_tx(executor_client):
 def sign_and_execute(unsigned_bytes, executor_client):
     """Deserialize, sign, and execute a transaction."""
     try:
-        # Deserialize
         tx = Transaction.from_bytes(unsigned_bytes)
-        print("Transaction deserialized (unsigned).")
+    except ValueError as exc:
+        raise RuntimeError(f"Transaction deserialization failed: {exc}") from exc
+    print("Transaction deserialized (unsigned).")
 
-        # Sign with executor client private key
-        tx.sign(executor_client.operator_private_key)
-        print("Transaction signed.")
+    # Sign with executor client private key
+    tx.sign(executor_client.operator_private_key)
+    print("Transaction signed.")
 
+    try:
         receipt = tx.execute(executor_client)
+    except (PrecheckError, MaxAttemptsError) as exc:
+        raise RuntimeError(f"Transaction execution failed: {exc}") from exc
 
-        if receipt.status != ResponseCode.SUCCESS:
-            raise RuntimeError(f"Transaction failed with status: {ResponseCode(receipt.status).name}")
-
-        print("Transaction executed successfully.")
-        print("Receipt:", receipt)
+    if receipt.status != ResponseCode.SUCCESS:
+        raise RuntimeError(f"Transaction failed with status: {ResponseCode(receipt.status).name}")
 
-    except Exception as exc:
-        raise RuntimeError(f"Transaction execution failed: {exc}") from exc
+    print("Transaction executed successfully.")
+    print("Receipt:", receipt)
 
 
 def main():
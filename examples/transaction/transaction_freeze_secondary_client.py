@@ -9,28 +9,22 @@ uv run examples/transaction/transaction_freeze_secondary_client.py
 python examples/transaction/transaction_freeze_secondary_client.py
 """
 
-import os
 import sys
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import (
     AccountCreateTransaction,
     Client,
-    Network,
+    PrecheckError,
     PrivateKey,
     ResponseCode,
     TopicCreateTransaction,
     Transaction,
     TransactionId,
 )
+from hiero_sdk_python.exceptions import MaxAttemptsError
 
 
-load_dotenv()
-
-NETWORK_NAME = os.getenv("NETWORK", "testnet").lower()
-OPERATOR_ID = os.getenv("OPERATOR_ID")
-OPERATOR_KEY = os.getenv("OPERATOR_KEY")
+TOPIC_MEMO = "Test Topic Creation"
 
 
 def setup_client() -> Client:
@@ -56,7 +50,8 @@ def create_secondary_client(executor_client):
     account_id = receipt.account_id
     print(f"Secondary account created: {account_id}")
 
-    secondary_client = Client(Network(NETWORK_NAME))
+    # Reuse the executor's network so both clients share the same node channels
+    secondary_client = Client(executor_client.network)
     secondary_client.set_operator(account_id, private_key)
 
     return secondary_client
@@ -70,7 +65,7 @@ def build_unsigned_bytes(executor_client, secondary_client):
     """
     tx_id = TransactionId.generate(executor_client.operator_account_id)
 
-    tx = TopicCreateTransaction().set_memo("Test Topic Creation").set_transaction_id(tx_id)
+    tx = TopicCreateTransaction().set_memo(TOPIC_MEMO).set_transaction_id(tx_id)
 
     # Manually freeze the transaction using the secondary client
     tx.freeze_with(secondary_client)
@@ -89,20 +84,24 @@ def sign_and_execute(unsigned_bytes, executor_client):
     """
     try:
         tx = Transaction.from_bytes(unsigned_bytes)
-        print("Transaction deserialized (unsigned).")
+    except ValueError as exc:
+        raise RuntimeError(f"Transaction deserialization failed: {exc}") from exc
+    print("Transaction deserialized (unsigned).")
 
-        tx.sign(executor_client.operator_private_key)
-        print("Transaction signed by executor.")
+    # Sign with executor client private key
+    tx.sign(executor_client.operator_private_key)
+    print("Transaction signed by executor.")
 
+    try:
         receipt = tx.execute(executor_client)
-        if receipt.status != ResponseCode.SUCCESS:
-            raise RuntimeError(f"Transaction failed with status: {ResponseCode(receipt.status).name}")
+    except (PrecheckError, MaxAttemptsError) as exc:
+        raise RuntimeError(f"Transaction execution failed: {exc}") from exc
 
-        print("Transaction executed successfully.")
-        print("Receipt:", receipt)
+    if receipt.status != ResponseCode.SUCCESS:
+        raise RuntimeError(f"Transaction failed with status: {ResponseCode(receipt.status).name}")
 
-    except Exception as exc:
-        raise RuntimeError(f"Transaction execution failed: {exc}") from exc
+    print("Transaction executed successfully.")
+    print("Receipt:", receipt)
 
 
 def main():
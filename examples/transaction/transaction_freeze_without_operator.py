@@ -9,26 +9,20 @@ uv run examples/transaction/transaction_freeze_without_operator.py
 python examples/transaction/transaction_freeze_without_operator.py
 """
 
-import os
 import sys
 
-from dotenv import load_dotenv
-
 from hiero_sdk_python import (
     Client,
-    Network,
+    PrecheckError,
     ResponseCode,
     TopicCreateTransaction,
     Transaction,
     TransactionId,
 )
+from hiero_sdk_python.exceptions import MaxAttemptsError
 
 
-load_dotenv()
-
-NETWORK_NAME = os.getenv("NETWORK", "testnet").lower()
-OPERATOR_ID = os.getenv("OPERATOR_ID")
-OPERATOR_KEY = os.getenv("OPERATOR_KEY")
+TOPIC_MEMO = "Test Topic Creation"
 
 
 def setup_client() -> Client:
@@ -40,9 +34,9 @@ def setup_client() -> Client:
     return client
 
 
-def create_client_without_operator():
-    """Create a client without an operator."""
-    return Client(Network(NETWORK_NAME))
+def create_client_without_operator(executor_client):
+    """Create a client without an operator that shares the executor's network channels."""
+    return Client(executor_client.network)
 
 
 def build_unsigned_bytes(executor_client, secondary_client):
@@ -53,7 +47,7 @@ def build_unsigned_bytes(executor_client, secondary_client):
     """
     tx_id = TransactionId.generate(executor_client.operator_account_id)
 
-    tx = TopicCreateTransaction().set_memo("Test Topic Creation").set_transaction_id(tx_id)
+    tx = TopicCreateTransaction().set_memo(TOPIC_MEMO).set_transaction_id(tx_id)
 
     # Manually freeze the transaction using the secondary client having no operator
     tx.freeze_with(secondary_client)
@@ -72,20 +66,24 @@ def sign_and_execute(unsigned_bytes, executor_client):
     """
     try:
         tx = Transaction.from_bytes(unsigned_bytes)
-        print("Transaction deserialized (unsigned).")
+    except ValueError as exc:
+        raise RuntimeError(f"Transaction deserialization failed: {exc}") from exc
+    print("Transaction deserialized (unsigned).")
 
-        tx.sign(executor_client.operator_private_key)
-        print("Transaction signed by executor.")
+    # Sign with executor client private key
+    tx.sign(executor_client.operator_private_key)
+    print("Transaction signed by executor.")
 
+    try:
         receipt = tx.execute(executor_client)
-        if receipt.status != ResponseCode.SUCCESS:
-            raise RuntimeError(f"Transaction failed with status: {ResponseCode(receipt.status).name}")
+    except (PrecheckError, MaxAttemptsError) as exc:
+        raise RuntimeError(f"Transaction execution failed: {exc}") from exc
 
-        print("Transaction executed successfully.")
-        print("Receipt:", receipt)
+    if receipt.status != ResponseCode.SUCCESS:
+        raise RuntimeError(f"Transaction failed with status: {ResponseCode(receipt.status).name}")
 
-    except Exception as exc:
-        raise RuntimeError(f"Transaction execution failed: {exc}") from exc
+    print("Transaction executed successfully.")
+    print("Receipt:", receipt)
 
 
 def main():
@@ -101,7 +99,7 @@ def main():
     """
     try:
         executor_client = setup_client()
-        secondary_client = create_client_without_operator()
+        secondary_client = create_client_without_operator(executor_client)
 
         unsigned_bytes = build_unsigned_bytes(
             executor_client,
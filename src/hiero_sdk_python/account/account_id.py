@@ -3,14 +3,15 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from hiero_sdk_python.crypto.evm_address import EvmAddress
 from hiero_sdk_python.crypto.public_key import PublicKey
 from hiero_sdk_python.hapi.services import basic_types_pb2
 from hiero_sdk_python.utils.entity_id_helper import (
+    ID_REGEX,
     format_to_string_with_checksum,
-    parse_from_string,
     perform_query_to_mirror_node,
     to_solidity_address,
     validate_checksum,
@@ -21,6 +22,24 @@ if TYPE_CHECKING:
     from hiero_sdk_python.client.client import Client
 
 ALIAS_REGEX = re.compile(r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.((?:[0-9a-fA-F][0-9a-fA-F])+)$")
+EVM_ADDRESS_REGEX = re.compile(r"\A(?:0x)?[0-9a-fA-F]{40}\Z")
+
+
+@lru_cache(maxsize=4096)
+def _parse_numeric_id(account_id_str: str) -> tuple[int, int, int, str | None] | None:
+    """
+    Parse a 'shard.realm.num[-checksum]' string into ints, or return None if it does not match.
+
+    Results are memoized because the same IDs (node accounts, treasury, operator) are parsed
+    over and over. Only the parsed values are cached; callers still build a new AccountId,
+    since instances are mutable and must not be shared.
+    """
+    match = ID_REGEX.match(account_id_str)
+    if not match:
+        return None
+
+    shard, realm, num, checksum = match.groups()
+    return int(shard), int(realm), int(num), checksum
 
 
 class AccountId:
@@ -37,6 +56,19 @@ class AccountId:
     - The alias format is `<shardNum>.<realmNum>.<alias>`, where `alias` is the public key or evm address
     """
 
+    __slots__ = (
+        "shard",
+        "realm",
+        "num",
+        "alias_key",
+        "evm_address",
+        "__checksum",
+        "_str_cache",
+        "_repr_cache",
+        "_bytes_cache",
+        "_evm_address_cache",
+    )
+
     def __init__(
         self,
         shard: int = 0,
@@ -61,6 +93,11 @@ class AccountId:
         self.alias_key = alias_key
         self.evm_address = evm_address
         self.__checksum: str | None = None
+        # (fields, text) pairs; the text is reused only while the fields it was built from are unchanged.
+        self._str_cache: tuple[tuple, str] | None = None
+        self._repr_cache: tuple[tuple, str] | None = None
+        self._bytes_cache: tuple[tuple, bytes] | None = None
+        self._evm_address_cache: tuple[tuple, str] | None = None
 
     @classmethod
     def from_string(cls, account_id_str: str) -> AccountId:
@@ -91,40 +128,36 @@ class AccountId:
             # via the mirror node using populate_account_num().
             return cls.from_evm_address(account_id_str, 0, 0)
 
-        try:
-            shard, realm, num, checksum = parse_from_string(account_id_str)
+        parsed = _parse_numeric_id(account_id_str)
+        if parsed is not None:
+            shard, realm, num, checksum = parsed
 
-            account_id: AccountId = cls(shard=int(shard), realm=int(realm), num=int(num))
+            account_id: AccountId = cls(shard=shard, realm=realm, num=num)
             account_id.__checksum = checksum
 
             return account_id
-        except Exception as e:
-            alias_match = ALIAS_REGEX.match(account_id_str)
-
-            if alias_match:
-                shard, realm, alias = alias_match.groups()
-                alias_bytes = bytes.fromhex(alias)
-
-                is_evm_address = len(alias_bytes) == 20
-
-                # num is set to 0 because the numeric account ID is unknown at creation time.
-                # It can later be populated via the mirror node using populate_account_num().
-                return cls(
-                    shard=int(shard),
-                    realm=int(realm),
-                    num=0,
-                    alias_key=(PublicKey.from_bytes(alias_bytes) if not is_evm_address else None),
-                    evm_address=(EvmAddress.from_bytes(alias_bytes) if is_evm_address else None),
-                )
-
-            raise ValueError(
-                f"Invalid account ID string '{account_id_str}'."
-                "Supported formats: "
-                "'shard.realm.num', "
-                "'shard.realm.num-checksum', "
-                "'shard.realm.<hex-alias>', "
-                "or a 20-byte EVM address."
-            ) from e
+
+        alias_match = ALIAS_REGEX.match(account_id_str)
+        if alias_match:
+            shard, realm, alias = alias_match.groups()
+            alias_bytes = bytes.fromhex(alias)
+
+            # num is set to 0 because the numeric account ID is unknown at creation time.
+            # It can later be populated via the mirror node using populate_account_num().
+            # ALIAS_REGEX only accepts whole hex bytes, so 40 characters means a 20-byte EVM address.
+            if len(alias) == 40:
+                return cls(shard=int(shard), realm=int(realm), num=0, evm_address=EvmAddress.from_bytes(alias_bytes))
+
+            return cls(shard=int(shard), realm=int(realm), num=0, alias_key=PublicKey.from_bytes(alias_bytes))
+
+        raise ValueError(
+            f"Invalid account ID string '{account_id_str}'."
+            "Supported formats: "
+            "'shard.realm.num', "
+            "'shard.realm.num-checksum', "
+            "'shard.realm.<hex-alias>', "
+            "or a 20-byte EVM address."
+        )
 
     @classmethod
     def from_evm_address(cls, evm_address: str | EvmAddress, shard: int, realm: int) -> AccountId:
@@ -241,26 +274,24 @@ class AccountId:
     @staticmethod
     def _is_evm_address(value: str) -> bool:
         """Check if the given string value is an evm_address."""
-        if value.startswith("0x"):
-            value = value[2:]
-
-        if len(value) != 40:
-            return False
-
-        try:
-            bytes.fromhex(value)
-        except ValueError:
-            return False
-
-        return True
+        return EVM_ADDRESS_REGEX.match(value) is not None
 
     def __str__(self) -> str:
         """Returns the string representation of the AccountId in 'shard.realm.num' format."""
+        fields = (self.shard, self.realm, self.num, self.alias_key, self.evm_address)
+        cached = self._str_cache
+        if cached is not None and cached[0] == fields:
+            return cached[1]
+
         if self.alias_key:
-            return f"{self.shard}.{self.realm}.{self.alias_key.to_string()}"
-        if self.evm_address:
-            return f"{self.shard}.{self.realm}.{self.evm_address.to_string()}"
-        return f"{self.shard}.{self.realm}.{self.num}"
+            text = f"{self.shard}.{self.realm}.{self.alias_key.to_string()}"
+        elif self.evm_address:
+            text = f"{self.shard}.{self.realm}.{self.evm_address.to_string()}"
+        else:
+            text = f"{self.shard}.{self.realm}.{self.num}"
+
+        self._str_cache = (fields, text)
+        return text
 
     def to_string_with_checksum(self, client: Client) -> str:
         """
@@ -350,22 +381,46 @@ class AccountId:
 
     def to_evm_address(self) -> str:
         """Return the EVM-compatible address for this account. Using account num."""
+        fields = (self.shard, self.realm, self.num, self.evm_address)
+        cached = self._evm_address_cache
+        if cached is not None and cached[0] == fields:
+            return cached[1]
+
         if self.evm_address:
-            return self.evm_address.to_string()
+            address = self.evm_address.to_string()
+        else:
+            address = to_solidity_address(self.shard, self.realm, self.num)
 
-        return to_solidity_address(self.shard, self.realm, self.num)
+        self._evm_address_cache = (fields, address)
+        return address
 
     def to_bytes(self) -> bytes:
         """Serialize this AccountId to protobuf bytes."""
-        return self._to_proto().SerializeToString()
+        fields = (self.shard, self.realm, self.num, self.alias_key, self.evm_address)
+        cached = self._bytes_cache
+        if cached is not None and cached[0] == fields:
+            return cached[1]
+
+        data = self._to_proto().SerializeToString()
+        self._bytes_cache = (fields, data)
+        return data
 
     def __repr__(self) -> str:
         """Returns the repr representation of the AccountId."""
+        fields = (self.shard, self.realm, self.num, self.alias_key, self.evm_address)
+        cached = self._repr_cache
+        if cached is not None and cached[0] == fields:
+            return cached[1]
+
         if self.alias_key:
-            return f"AccountId(shard={self.shard}, realm={self.realm}, alias_key={self.alias_key.to_string_raw()})"
-        if self.evm_address:
-            return f"AccountId(shard={self.shard}, realm={self.realm}, evm_address={self.evm_address.to_string()})"
-        return f"AccountId(shard={self.shard}, realm={self.realm}, num={self.num})"
+            text = f"AccountId(shard={self.shard}, realm={self.realm}, alias_key={self.alias_key.to_string_raw()})"
+        elif self.evm_address:
+            text = f"AccountId(shard={self.shard}, realm={self.realm}, evm_address={self.evm_address.to_string()})"
+        else:
+            text = f"AccountId(shard={self.shard}, realm={self.realm}, num={self.num})"
+
+        self._repr_cache = (fields, text)
+        return text
 
     def __eq__(self, other: object) -> bool:
         """
@@ -252,6 +252,18 @@ class Client:
         """Determine if certificate verification is enabled."""
         return self.network.is_verify_certificates()
 
+    def prefetch_certificates(self, max_workers: int = 16) -> Client:
+        """
+        Fetch the TLS certificates of all consensus nodes in parallel.
+
+        Note:
+            Certificates are fetched lazily per node by default. Call this once after
+            creating the client to overlap those handshakes, e.g. before sending
+            requests to many different nodes.
+        """
+        self.network.prefetch_certificates(max_workers)
+        return self
+
     def set_tls_root_certificates(self, root_certificates: bytes | None) -> Client:
         """Provide custom root certificates for TLS connections."""
         self.network.set_tls_root_certificates(root_certificates)
@@ -367,6 +367,15 @@ class Network:
             node._set_verify_certificates(verify)  # pylint: disable=protected-access
         self._verify_certificates = verify
 
+    def prefetch_certificates(self, max_workers: int = 16) -> None:
+        """
+        Fetch the TLS certificates of all nodes in parallel ahead of their first request.
+
+        Certificates are otherwise fetched lazily, one node at a time, when a node is first used.
+        Nodes that cannot be reached are skipped and fall back to the lazy fetch.
+        """
+        _Node._prefetch_certificates(self.nodes, max_workers)  # pylint: disable=protected-access
+
     def set_tls_root_certificates(self, root_certificates: bytes | None) -> None:
         """Provide custom root certificates to use when establishing TLS channels."""
         self._root_certificates = root_certificates
@@ -450,7 +459,8 @@ class Network:
 
         if self.nodes:
             for node in self.nodes:
-                node._close()
+                # Closing the client also drops fetched certificates, so reconnecting fetches them again
+                node._close(forget_certificate=True)
 
     def get_mirror_stub(self) -> mirror_consensus_grpc.ConsensusServiceStub:
         """Returns the mirror stub."""
@@ -233,6 +233,15 @@ class TopicMessageSubmitTransaction(ChunkedTransaction):
         """
         return _Method(transaction_func=channel.topic.submitMessage, query_func=None)
 
+    def _requires_ordered_chunks(self) -> bool:
+        """
+        Topic message chunks carry their own chunk number and are reassembled by the mirror node.
+
+        Returns:
+            bool: Always False, so chunks are submitted before any receipt is requested.
+        """
+        return False
+
     def sign(self, private_key: PrivateKey) -> TopicMessageSubmitTransaction:
         """
         Signs the transaction using the provided private key.
@@ -30,6 +30,7 @@ class PrivateKey(Key):
     def __init__(self, private_key: ec.EllipticCurvePrivateKey | ed25519.Ed25519PrivateKey) -> None:
         """Initializes a PrivateKey from a cryptography PrivateKey object."""
         self._private_key: ec.EllipticCurvePrivateKey | ed25519.Ed25519PrivateKey = private_key
+        self._public_key: PublicKey | None = None
 
     #
     # ---------------------------------
@@ -291,8 +292,15 @@ class PrivateKey(Key):
         return r.to_bytes(32, "big") + s.to_bytes(32, "big")
 
     def public_key(self) -> PublicKey:
-        """Derive the public key from this private key."""
-        return PublicKey(self._private_key.public_key())
+        """
+        Derive the public key from this private key.
+
+        The key is derived on first use and cached, since signing and
+        execution ask for it on every call.
+        """
+        if self._public_key is None:
+            self._public_key = PublicKey(self._private_key.public_key())
+        return self._public_key
 
     #
     # ---------------------------------
@@ -15,6 +15,7 @@ from hiero_sdk_python.account.account_id import AccountId
 from hiero_sdk_python.channels import _Channel
 from hiero_sdk_python.exceptions import MaxAttemptsError
 from hiero_sdk_python.hapi.services import query_pb2, transaction_pb2
+from hiero_sdk_python.logger.log_level import LogLevel
 from hiero_sdk_python.logger.logger import Logger
 from hiero_sdk_python.response_code import ResponseCode
 
@@ -418,6 +419,8 @@ class _Executable(ABC):
         tx_id = getattr(self, "transaction_id", None)
 
         logger = client.logger
+        # Trace arguments (request IDs, f-strings) are only built when they will be emitted
+        trace_enabled = logger.is_enabled_for(LogLevel.TRACE)
         start = time.monotonic()
 
         for attempt in range(self._max_attempts):
@@ -437,17 +440,18 @@ class _Executable(ABC):
             # Create a channel wrapper from the client's channel
             channel = node._get_channel()
 
-            logger.trace(
-                "Executing",
-                "requestId",
-                self._get_request_id(),
-                "nodeAccountID",
-                self.node_account_id,
-                "attempt",
-                attempt + 1,
-                "maxAttempts",
-                self._max_attempts,
-            )
+            if trace_enabled:
+                logger.trace(
+                    "Executing",
+                    "requestId",
+                    self._get_request_id(),
+                    "nodeAccountID",
+                    self.node_account_id,
+                    "attempt",
+                    attempt + 1,
+                    "maxAttempts",
+                    self._max_attempts,
+                )
 
             # Get the appropriate gRPC method to call
             method = self._get_method(channel)
@@ -461,7 +465,8 @@ class _Executable(ABC):
 
             # Execute the GRPC call
             try:
-                logger.trace("Executing gRPC call", "requestId", self._get_request_id())
+                if trace_enabled:
+                    logger.trace("Executing gRPC call", "requestId", self._get_request_id())
                 response = _execute_method(method, proto_request, self._grpc_deadline)
 
             except Exception as e:
@@ -480,17 +485,18 @@ class _Executable(ABC):
 
             # Determine if we should retry based on the response
             execution_state = self._should_retry(response)
-            logger.trace(
-                f"{self.__class__.__name__} status received",
-                "nodeAccountID",
-                self.node_account_id,
-                "network",
-                client.network.network,
-                "state",
-                execution_state.name,
-                "txID",
-                tx_id,
-            )
+            if trace_enabled:
+                logger.trace(
+                    f"{self.__class__.__name__} status received",
+                    "nodeAccountID",
+                    self.node_account_id,
+                    "network",
+                    client.network.network,
+                    "state",
+                    execution_state.name,
+                    "txID",
+                    tx_id,
+                )
 
             # Handle the execution state
             match execution_state:
@@ -517,7 +523,8 @@ class _Executable(ABC):
                     raise status_error
                 case _ExecutionState.FINISHED:
                     # If the transaction completed successfully, map the response and return it
-                    logger.trace(f"{self.__class__.__name__} finished execution")
+                    if trace_enabled:
+                        logger.trace(f"{self.__class__.__name__} finished execution")
                     return self._map_response(response, self.node_account_id, proto_request)
 
         logger.error(
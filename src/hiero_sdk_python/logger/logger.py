@@ -107,6 +107,20 @@ class Logger:
 
         return self
 
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """
+        Checks whether a message at the given level would be emitted.
+
+        Callers can use this to skip building expensive log arguments.
+
+        Args:
+            level (LogLevel): The log level to check.
+
+        Returns:
+            bool: True if messages at this level are currently logged.
+        """
+        return self.internal_logger.isEnabledFor(level.value)
+
     def _format_args(self, message: str, args: Sequence[object]) -> str:
         """
         Formats a message with optional key-value pairs into a clean string format.
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import base64
 import hashlib
+import hmac
 import socket
 import ssl  # Python's ssl module implements TLS (despite the name)
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 
 import grpc
 
@@ -16,6 +20,52 @@ from hiero_sdk_python.managed_node_address import _ManagedNodeAddress
 # Timeout for fetching server certificates during TLS validation
 CERT_FETCH_TIMEOUT_SECONDS = 10
 
+# gRPC options for TLS channels; see _Node._build_channel_options for why the authority is fixed
+_GRPC_CHANNEL_OPTIONS = (
+    ("grpc.default_authority", "127.0.0.1"),
+    ("grpc.ssl_target_name_override", "127.0.0.1"),
+    ("grpc.keepalive_time_ms", 100000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 1),
+)
+
+
+@cache
+def _cert_fetch_context() -> ssl.SSLContext:
+    """
+    Return the TLS context shared by all certificate fetches.
+
+    The context is built on first use and reused, so the system trust store is only
+    loaded once per process. SSLContext.wrap_socket is safe to call from multiple threads.
+    """
+    # Create TLS context that accepts any certificate (we validate hash ourselves)
+    context = ssl.create_default_context()
+    # Restrict SSL/TLS versions to TLSv1.2+ only for security
+    if hasattr(context, "minimum_version") and hasattr(ssl, "TLSVersion"):
+        context.minimum_version = ssl.TLSVersion.TLSv1_2
+    else:
+        # Backwards compatibility for Python <3.7 that lacks minimum_version
+        context.options |= ssl.OP_NO_TLSv1 | ssl.OP_NO_TLSv1_1
+
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def _der_to_pem_bytes(der_cert: bytes) -> bytes:
+    """
+    Encode a DER certificate as PEM bytes.
+
+    Produces the same output as ``ssl.DER_cert_to_PEM_cert(der_cert).encode()`` (64-character
+    base64 lines), which the address book certificate hashes are computed over, without the
+    intermediate str round-trip.
+    """
+    encoded = base64.b64encode(der_cert)
+    lines = [b"-----BEGIN CERTIFICATE-----"]
+    lines += [encoded[i : i + 64] for i in range(0, len(encoded), 64)]
+    lines.append(b"-----END CERTIFICATE-----\n")
+    return b"\n".join(lines)
+
 
 class _HederaTrustManager:
     """
@@ -39,6 +89,7 @@ class _HederaTrustManager:
                     "but no applicable address book was found"
                 )
             self.cert_hash = None
+            self._expected_digest: bytes | None = None
         else:
             # Convert bytes to hex string (matching Java's String conversion)
             try:
@@ -48,6 +99,13 @@ class _HederaTrustManager:
             except UnicodeDecodeError:
                 self.cert_hash = cert_hash.hex().lower()
 
+            # Decode the expected hash once so each handshake compares raw digest bytes
+            try:
+                self._expected_digest = bytes.fromhex(self.cert_hash)
+            except ValueError:
+                # Not hex, so no SHA-384 digest can ever match it
+                self._expected_digest = None
+
     def check_server_trusted(self, pem_cert: bytes) -> bool:
         """
         Validate a server certificate by comparing its hash to the expected hash.
@@ -66,12 +124,12 @@ class _HederaTrustManager:
 
         # Compute SHA-384 hash of PEM certificate (matching Java implementation)
         cert_hash_bytes = hashlib.sha384(pem_cert).digest()
-        actual_hash = cert_hash_bytes.hex().lower()
 
-        if actual_hash != self.cert_hash:
+        # Constant-time comparison so the check does not leak how many leading bytes matched
+        if self._expected_digest is None or not hmac.compare_digest(cert_hash_bytes, self._expected_digest):
             raise ValueError(
                 f"Failed to confirm the server's certificate from a known address book. "
-                f"Expected hash: {self.cert_hash}, received hash: {actual_hash}"
+                f"Expected hash: {self.cert_hash}, received hash: {cert_hash_bytes.hex()}"
             )
 
         return True
@@ -94,6 +152,10 @@ class _Node:
         self._verify_certificates: bool = True
         self._root_certificates: bytes | None = None
         self._node_pem_cert: bytes | None = None
+        # Certificate fetched from the node itself; kept so channel rebuilds skip the extra handshake
+        self._fetched_pem_cert: bytes | None = None
+        # (pem_cert, cert_hash) pair that last passed validation
+        self._validated_cert: tuple[bytes, bytes] | None = None
 
         self._min_backoff: float = 8  # seconds
         self._max_backoff: float = 3600  # seconds
@@ -101,10 +163,27 @@ class _Node:
         self._readmit_time: float = time.monotonic()
         self._bad_grpc_response_count: int = 0
 
-    def _close(self):
+    @property
+    def _address(self) -> _ManagedNodeAddress:
+        """The managed address of this node."""
+        return self._managed_address
+
+    @_address.setter
+    def _address(self, address: _ManagedNodeAddress) -> None:
+        """Replace the node's address and refresh the values derived from it."""
+        self._managed_address = address
+        # Cached so channel creation and the TLS setters don't recompute them on every call
+        self._is_tls: bool = address._is_transport_security()
+        self._target: str = str(address)
+
+    def _close(self, forget_certificate: bool = False):
         """
         Close the channel for this node.
 
+        Args:
+            forget_certificate (bool): Also drop the certificate fetched from the node, so the
+                next channel fetches it again. Channel rebuilds keep it; closing the client drops it.
+
         Returns:
             None
         """
@@ -112,6 +191,9 @@ class _Node:
             self._channel.channel.close()
             self._channel = None
 
+        if forget_certificate:
+            self._fetched_pem_cert = None
+
     def _get_channel(self):
         """
         Get the channel for this node.
@@ -122,21 +204,29 @@ class _Node:
         if self._channel:
             return self._channel
 
-        if self._address._is_transport_security():
+        if self._is_tls:
             if self._root_certificates:
                 # Use the certificate that is provided
                 self._node_pem_cert = self._root_certificates
 
             else:
-                # Fetch pem_cert for the node
-                self._node_pem_cert = self._fetch_server_certificate_pem()
+                # Fetch pem_cert for the node, unless an earlier channel or _prefetch_certificates already did
+                self._node_pem_cert = self._fetched_pem_cert or self._fetch_server_certificate_pem()
 
             if not self._node_pem_cert:
                 raise ValueError("No certificate available.")
 
             # Validate certificate if verification is enabled
             if self._verify_certificates:
-                self._validate_tls_certificate_with_trust_manager()
+                try:
+                    self._validate_tls_certificate_with_trust_manager()
+                except ValueError:
+                    # Don't keep a certificate that failed pinning; the next channel fetches a fresh one
+                    self._fetched_pem_cert = None
+                    raise
+
+            if not self._root_certificates:
+                self._fetched_pem_cert = self._node_pem_cert
 
             options = self._build_channel_options()
             credentials = grpc.ssl_channel_credentials(
@@ -144,9 +234,9 @@ class _Node:
                 private_key=None,
                 certificate_chain=None,
             )
-            channel = grpc.secure_channel(str(self._address), credentials, options=options)
+            channel = grpc.secure_channel(self._target, credentials, options=options)
         else:
-            channel = grpc.insecure_channel(str(self._address))
+            channel = grpc.insecure_channel(self._target)
 
         channel = grpc.intercept_channel(channel, _UserAgentInterceptor())
 
@@ -154,11 +244,55 @@ class _Node:
 
         return self._channel
 
+    @staticmethod
+    def _prefetch_certificates(nodes: list[_Node], max_workers: int = 16) -> None:
+        """
+        Fetch and validate the server certificates of several nodes in parallel.
+
+        Each fetch is a blocking TLS handshake, so running them on a thread pool overlaps
+        the round trips instead of paying them one node at a time in `_get_channel`.
+        When verification is enabled, each certificate is also checked against the address
+        book hash on the worker thread. Accepted certificates are kept on the node and used
+        by `_get_channel`. Nodes that cannot be reached or whose certificate does not match
+        are skipped and go through the lazy fetch, which reports the error, as before.
+
+        Args:
+            nodes (list[_Node]): The nodes to fetch certificates for.
+            max_workers (int): The maximum number of concurrent handshakes.
+        """
+        pending = [
+            node
+            for node in nodes
+            # Same condition under which _get_channel fetches the certificate itself
+            if node._fetched_pem_cert is None and not node._root_certificates and node._is_tls
+        ]
+        if not pending:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            futures = [(node, executor.submit(node._fetch_validated_certificate)) for node in pending]
+
+        for node, future in futures:
+            error = future.exception()
+            if error is None:
+                node._fetched_pem_cert = future.result()
+            elif not isinstance(error, (OSError, ValueError)):
+                # OSError covers socket errors, timeouts and ssl.SSLError and ValueError a hash
+                # mismatch; _get_channel retries those and raises if they persist
+                raise error
+
+    def _fetch_validated_certificate(self) -> bytes | None:
+        """Fetch the server certificate and validate it against the address book when verification is on."""
+        pem_cert = self._fetch_server_certificate_pem()
+        if pem_cert:
+            self._validate_tls_certificate_with_trust_manager(pem_cert)
+        return pem_cert
+
     def _apply_transport_security(self, enabled: bool):
         """Update the node's address to use secure or insecure transport."""
-        if enabled and self._address._is_transport_security():
+        if enabled and self._is_tls:
             return
-        if not enabled and not self._address._is_transport_security():
+        if not enabled and not self._is_tls:
             return
 
         self._close()
@@ -171,7 +305,7 @@ class _Node:
     def _set_root_certificates(self, root_certificates: bytes | None):
         """Assign custom root certificates used for TLS verification."""
         self._root_certificates = root_certificates
-        if self._channel and self._address._is_transport_security():
+        if self._channel and self._is_tls:
             self._close()
 
     def _set_verify_certificates(self, verify: bool):
@@ -181,11 +315,11 @@ class _Node:
 
         self._verify_certificates = verify
 
-        if verify and self._channel and self._address._is_transport_security():
+        if verify and self._channel and self._is_tls:
             # Force channel recreation to ensure certificates are revalidated.
             self._close()
 
-    def _build_channel_options(self):
+    def _build_channel_options(self) -> tuple[tuple[str, str | int], ...]:
         """
         Build gRPC channel options for TLS connections.
 
@@ -203,25 +337,25 @@ class _Node:
         by performing certificate hash pinning. This guarantees the client is
         communicating with the correct Hedera node regardless of the hostname
         or IP address used to connect.
+
+        The options are identical for every node, so the shared module-level
+        `_GRPC_CHANNEL_OPTIONS` tuple is returned.
         """
-        return [
-            ("grpc.default_authority", "127.0.0.1"),
-            ("grpc.ssl_target_name_override", "127.0.0.1"),
-            ("grpc.keepalive_time_ms", 100000),
-            ("grpc.keepalive_timeout_ms", 10000),
-            ("grpc.keepalive_permit_without_calls", 1),
-        ]
+        return _GRPC_CHANNEL_OPTIONS
 
-    def _validate_tls_certificate_with_trust_manager(self):
+    def _validate_tls_certificate_with_trust_manager(self, pem_cert: bytes | None = None):
         """
         Validate the remote TLS certificate using HederaTrustManager.
         This performs a pre-handshake validation by fetching the server certificate
         and comparing its hash to the expected hash from the address book.
 
+        Args:
+            pem_cert (bytes, optional): The certificate to validate. Defaults to the node's current certificate.
+
         Note: If verification is enabled but no cert hash is available (e.g., in unit tests
         without address books), validation is skipped rather than raising an error.
         """
-        if not self._address._is_transport_security() or not self._verify_certificates:
+        if not self._is_tls or not self._verify_certificates:
             return
 
         cert_hash = None
@@ -234,9 +368,17 @@ class _Node:
         if cert_hash is None or len(cert_hash) == 0:
             return
 
+        if pem_cert is None:
+            pem_cert = self._node_pem_cert
+
+        # A channel rebuild for the same certificate and address book hash needs no new check
+        if self._validated_cert == (pem_cert, cert_hash):
+            return
+
         # Create trust manager and validate certificate
         trust_manager = _HederaTrustManager(cert_hash, self._verify_certificates)
-        trust_manager.check_server_trusted(self._node_pem_cert)
+        trust_manager.check_server_trusted(pem_cert)
+        self._validated_cert = (pem_cert, cert_hash)
 
     @staticmethod
     def _normalize_cert_hash(cert_hash: bytes) -> str:
@@ -264,17 +406,7 @@ class _Node:
         port = self._address._get_port()
         server_hostname = host
 
-        # Create TLS context that accepts any certificate (we validate hash ourselves)
-        context = ssl.create_default_context()
-        # Restrict SSL/TLS versions to TLSv1.2+ only for security
-        if hasattr(context, "minimum_version") and hasattr(ssl, "TLSVersion"):
-            context.minimum_version = ssl.TLSVersion.TLSv1_2
-        else:
-            # Backwards compatibility for Python <3.7 that lacks minimum_version
-            context.options |= ssl.OP_NO_TLSv1 | ssl.OP_NO_TLSv1_1
-
-        context.check_hostname = False
-        context.verify_mode = ssl.CERT_NONE
+        context = _cert_fetch_context()
 
         with (
             socket.create_connection((host, port), timeout=CERT_FETCH_TIMEOUT_SECONDS) as sock,
@@ -283,7 +415,7 @@ class _Node:
             der_cert = tls_socket.getpeercert(True)
 
         # Convert DER to PEM format (matching Java's PEM encoding)
-        return ssl.DER_cert_to_PEM_cert(der_cert).encode("utf-8")
+        return _der_to_pem_bytes(der_cert)
 
     def is_healthy(self) -> bool:
         """
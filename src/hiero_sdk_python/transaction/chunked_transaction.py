@@ -56,6 +56,18 @@ class ChunkedTransaction(Transaction, ABC):
         """
         pass
 
+    def _requires_ordered_chunks(self) -> bool:
+        """
+        Whether each chunk must reach consensus before the next one is submitted.
+
+        Subclasses whose chunks can be reassembled in any order may return False so that
+        execute_all() submits every chunk first and only then collects the receipts.
+
+        Returns:
+            bool: True to wait for each chunk's receipt before submitting the next chunk.
+        """
+        return True
+
     def set_chunk_size(self, chunk_size: int) -> ChunkedTransaction:
         """
         Sets the chunk size for this transaction.
@@ -237,7 +249,9 @@ class ChunkedTransaction(Transaction, ABC):
         """
         Executes all chunks of the transaction sequentially.
 
-        Returns a list of responses for each chunk executed.
+        Returns a list of responses for each chunk executed. When the chunks do not need to
+        reach consensus in order (see _requires_ordered_chunks()), receipts are collected after
+        every chunk has been submitted instead of after each one.
 
         Args:
             client: The client to execute the transaction with.
@@ -267,6 +281,7 @@ class ChunkedTransaction(Transaction, ABC):
             self.freeze_with(client)
 
         responses = []
+        wait_for_each_chunk = self._requires_ordered_chunks()
 
         for chunk_index in range(self.get_required_chunks()):
             self._current_chunk_index = chunk_index
@@ -286,11 +301,17 @@ class ChunkedTransaction(Transaction, ABC):
             response = super().execute(
                 client,
                 timeout=timeout,
-                wait_for_receipt=wait_for_receipt,
+                wait_for_receipt=wait_for_receipt and wait_for_each_chunk,
                 validate_status=validate_status,
             )
             responses.append(response)
 
+        if wait_for_receipt and not wait_for_each_chunk:
+            # All chunks are already in flight, so only the first receipt waits for consensus.
+            return [
+                response.get_receipt(client, timeout=timeout, validate_status=validate_status) for response in responses
+            ]
+
         return responses
 
     def sign(self, private_key: PrivateKey) -> ChunkedTransaction:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+from functools import cache
 from typing import TYPE_CHECKING, Literal, overload
 
 from hiero_sdk_python.account.account_id import AccountId
@@ -28,6 +29,65 @@ if TYPE_CHECKING:
     from hiero_sdk_python.transaction.custom_fee_limit import CustomFeeLimit
 
 
+# Maps a protobuf TransactionBody ``data`` field name to the SDK class that restores it.
+_TRANSACTION_CLASS_PATHS: dict[str, str | None] = {
+    "cryptoTransfer": "hiero_sdk_python.transaction.transfer_transaction.TransferTransaction",
+    "contractCall": "hiero_sdk_python.contract.contract_execute_transaction.ContractExecuteTransaction",
+    "contractCreateInstance": "hiero_sdk_python.contract.contract_create_transaction.ContractCreateTransaction",
+    "contractUpdateInstance": "hiero_sdk_python.contract.contract_update_transaction.ContractUpdateTransaction",
+    "contractDeleteInstance": "hiero_sdk_python.contract.contract_delete_transaction.ContractDeleteTransaction",
+    "ethereumTransaction": "hiero_sdk_python.contract.ethereum_transaction.EthereumTransaction",
+    "cryptoAddLiveHash": None,  # Not implemented in SDK
+    "cryptoApproveAllowance": "hiero_sdk_python.account.account_allowance_approve_transaction.AccountAllowanceApproveTransaction",
+    "cryptoDeleteAllowance": "hiero_sdk_python.account.account_allowance_delete_transaction.AccountAllowanceDeleteTransaction",
+    "cryptoCreateAccount": "hiero_sdk_python.account.account_create_transaction.AccountCreateTransaction",
+    "cryptoDelete": "hiero_sdk_python.account.account_delete_transaction.AccountDeleteTransaction",
+    "cryptoDeleteLiveHash": None,  # Not implemented in SDK
+    "cryptoUpdateAccount": "hiero_sdk_python.account.account_update_transaction.AccountUpdateTransaction",
+    "fileAppend": "hiero_sdk_python.file.file_append_transaction.FileAppendTransaction",
+    "fileCreate": "hiero_sdk_python.file.file_create_transaction.FileCreateTransaction",
+    "fileDelete": "hiero_sdk_python.file.file_delete_transaction.FileDeleteTransaction",
+    "fileUpdate": "hiero_sdk_python.file.file_update_transaction.FileUpdateTransaction",
+    "systemDelete": None,  # Admin transaction
+    "systemUndelete": None,  # Admin transaction
+    "freeze": None,  # Admin transaction
+    "consensusCreateTopic": "hiero_sdk_python.consensus.topic_create_transaction.TopicCreateTransaction",
+    "consensusUpdateTopic": "hiero_sdk_python.consensus.topic_update_transaction.TopicUpdateTransaction",
+    "consensusDeleteTopic": "hiero_sdk_python.consensus.topic_delete_transaction.TopicDeleteTransaction",
+    "consensusSubmitMessage": "hiero_sdk_python.consensus.topic_message_submit_transaction.TopicMessageSubmitTransaction",
+    "tokenCreation": "hiero_sdk_python.tokens.token_create_transaction.TokenCreateTransaction",
+    "tokenFreeze": "hiero_sdk_python.tokens.token_freeze_transaction.TokenFreezeTransaction",
+    "tokenUnfreeze": "hiero_sdk_python.tokens.token_unfreeze_transaction.TokenUnfreezeTransaction",
+    "tokenGrantKyc": "hiero_sdk_python.tokens.token_grant_kyc_transaction.TokenGrantKycTransaction",
+    "tokenRevokeKyc": "hiero_sdk_python.tokens.token_revoke_kyc_transaction.TokenRevokeKycTransaction",
+    "tokenDeletion": "hiero_sdk_python.tokens.token_delete_transaction.TokenDeleteTransaction",
+    "tokenUpdate": "hiero_sdk_python.tokens.token_update_transaction.TokenUpdateTransaction",
+    "tokenMint": "hiero_sdk_python.tokens.token_mint_transaction.TokenMintTransaction",
+    "tokenBurn": "hiero_sdk_python.tokens.token_burn_transaction.TokenBurnTransaction",
+    "tokenWipe": "hiero_sdk_python.tokens.token_wipe_transaction.TokenWipeTransaction",
+    "tokenAssociate": "hiero_sdk_python.tokens.token_associate_transaction.TokenAssociateTransaction",
+    "tokenDissociate": "hiero_sdk_python.tokens.token_dissociate_transaction.TokenDissociateTransaction",
+    "tokenPause": "hiero_sdk_python.tokens.token_pause_transaction.TokenPauseTransaction",
+    "tokenUnpause": "hiero_sdk_python.tokens.token_pause_transaction.TokenUnpauseTransaction",
+    "scheduleCreate": "hiero_sdk_python.schedule.schedule_create_transaction.ScheduleCreateTransaction",
+    "scheduleDelete": "hiero_sdk_python.schedule.schedule_delete_transaction.ScheduleDeleteTransaction",
+    "scheduleSign": "hiero_sdk_python.schedule.schedule_sign_transaction.ScheduleSignTransaction",
+    "tokenFeeScheduleUpdate": None,  # Not commonly used
+    "tokenUpdateNfts": "hiero_sdk_python.tokens.token_update_nfts_transaction.TokenUpdateNftsTransaction",
+    "nodeCreate": "hiero_sdk_python.nodes.node_create_transaction.NodeCreateTransaction",
+    "nodeUpdate": "hiero_sdk_python.nodes.node_update_transaction.NodeUpdateTransaction",
+    "nodeDelete": "hiero_sdk_python.nodes.node_delete_transaction.NodeDeleteTransaction",
+    "registeredNodeCreate": "hiero_sdk_python.nodes.registered_node_create_transaction.RegisteredNodeCreateTransaction",
+    "registeredNodeUpdate": "hiero_sdk_python.nodes.registered_node_update_transaction.RegisteredNodeUpdateTransaction",
+    "registeredNodeDelete": "hiero_sdk_python.nodes.registered_node_delete_transaction.RegisteredNodeDeleteTransaction",
+    "utilPrng": "hiero_sdk_python.prng_transaction.PrngTransaction",
+    "tokenReject": "hiero_sdk_python.tokens.token_reject_transaction.TokenRejectTransaction",
+    "tokenAirdrop": "hiero_sdk_python.tokens.token_airdrop_transaction.TokenAirdropTransaction",
+    "tokenCancelAirdrop": "hiero_sdk_python.tokens.token_cancel_airdrop_transaction.TokenCancelAirdropTransaction",
+    "atomic_batch": "hiero_sdk_python.transaction.batch_transaction.BatchTransaction",
+}
+
+
 class Transaction(_Executable):
     """
     Base class for all Hedera transactions.
@@ -102,9 +162,8 @@ class Transaction(_Executable):
         if not isinstance(proto_request, transaction_pb2.Transaction):
             raise TypeError(f"Expected Transaction but got {type(proto_request)}")
 
-        hash_obj = hashlib.sha384()
-        hash_obj.update(proto_request.signedTransactionBytes)
-        tx_hash = hash_obj.digest()
+        # One-shot digest: hashing in the constructor avoids separate update()/digest() calls.
+        tx_hash = hashlib.sha384(proto_request.signedTransactionBytes).digest()
         transaction_response = TransactionResponse()
         transaction_response.transaction_id = self.transaction_id
         transaction_response.node_id = node_id
@@ -180,26 +239,28 @@ class Transaction(_Executable):
         # We require the transaction to be frozen before signing
         self._require_frozen()
 
+        # The public key and signature kind are the same for every node body,
+        # so derive them once instead of once per node.
+        public_key_bytes = private_key.public_key().to_bytes_raw()
+        is_ed25519 = private_key.is_ed25519()
+
         # We sign the bodies for each node in case we need to switch nodes during execution.
         for body_bytes in self._transaction_body_bytes.values():
-            signature = private_key.sign(body_bytes)
+            # We initialize the signature map for this body_bytes if it doesn't exist yet
+            sig_map = self._signature_map.setdefault(body_bytes, basic_types_pb2.SignatureMap())
 
-            public_key_bytes = private_key.public_key().to_bytes_raw()
+            # deduplication check, done before signing so repeated signs skip the crypto work
+            if any(sp.pubKeyPrefix == public_key_bytes for sp in sig_map.sigPair):
+                continue
 
-            if private_key.is_ed25519():
+            signature = private_key.sign(body_bytes)
+
+            if is_ed25519:
                 sig_pair = basic_types_pb2.SignaturePair(pubKeyPrefix=public_key_bytes, ed25519=signature)
             else:
                 sig_pair = basic_types_pb2.SignaturePair(pubKeyPrefix=public_key_bytes, ECDSA_secp256k1=signature)
 
-            # We initialize the signature map for this body_bytes if it doesn't exist yet
-            self._signature_map.setdefault(body_bytes, basic_types_pb2.SignatureMap())
-
-            # deduplication check
-            already_signed = any(sp.pubKeyPrefix == public_key_bytes for sp in self._signature_map[body_bytes].sigPair)
-
-            # append only if not already signed
-            if not already_signed:
-                self._signature_map[body_bytes].sigPair.append(sig_pair)
+            sig_map.sigPair.append(sig_pair)
 
         return self
 
@@ -309,18 +370,35 @@ class Transaction(_Executable):
 
         # Multiple node
         if len(self.node_account_ids) > 0:
-            for node_account_id in self.node_account_ids:
-                self.node_account_id = node_account_id
-                self._transaction_body_bytes[node_account_id] = self.build_transaction_body().SerializeToString()
+            self._build_node_body_bytes(self.node_account_ids)
 
         else:
             # Use all nodes from client network
-            for node in client.network.nodes:
-                self.node_account_id = node._account_id
-                self._transaction_body_bytes[node._account_id] = self.build_transaction_body().SerializeToString()
+            self._build_node_body_bytes([node._account_id for node in client.network.nodes])
 
         return self
 
+    def _build_node_body_bytes(self, node_account_ids: list[AccountId]) -> None:
+        """
+        Serializes one transaction body per node.
+
+        The bodies only differ in nodeAccountID, so the full body is built once
+        and used as a template; for every other node only that field is replaced
+        before serializing.
+
+        Args:
+            node_account_ids (list[AccountId]): The nodes to build transaction bodies for.
+        """
+        template = None
+        for node_account_id in node_account_ids:
+            self.node_account_id = node_account_id
+            if template is None:
+                template = self.build_transaction_body()
+            else:
+                template.nodeAccountID.CopyFrom(node_account_id._to_proto())
+
+            self._transaction_body_bytes[node_account_id] = template.SerializeToString()
+
     @overload
     def execute(
         self,
@@ -776,74 +854,20 @@ class Transaction(_Executable):
         )
 
     @staticmethod
+    @cache
     def _get_transaction_class(transaction_type: str):
         """
         Maps a protobuf transaction type field name to the corresponding Python class.
 
+        Resolved classes are cached so repeated from_bytes() calls skip the import lookup.
+
         Args:
             transaction_type (str): The protobuf field name (e.g., "cryptoTransfer")
 
         Returns:
             type: The corresponding transaction class, or None if unknown
         """
-        transaction_type_map = {
-            "cryptoTransfer": "hiero_sdk_python.transaction.transfer_transaction.TransferTransaction",
-            "contractCall": "hiero_sdk_python.contract.contract_execute_transaction.ContractExecuteTransaction",
-            "contractCreateInstance": "hiero_sdk_python.contract.contract_create_transaction.ContractCreateTransaction",
-            "contractUpdateInstance": "hiero_sdk_python.contract.contract_update_transaction.ContractUpdateTransaction",
-            "contractDeleteInstance": "hiero_sdk_python.contract.contract_delete_transaction.ContractDeleteTransaction",
-            "ethereumTransaction": "hiero_sdk_python.contract.ethereum_transaction.EthereumTransaction",
-            "cryptoAddLiveHash": None,  # Not implemented in SDK
-            "cryptoApproveAllowance": "hiero_sdk_python.account.account_allowance_approve_transaction.AccountAllowanceApproveTransaction",
-            "cryptoDeleteAllowance": "hiero_sdk_python.account.account_allowance_delete_transaction.AccountAllowanceDeleteTransaction",
-            "cryptoCreateAccount": "hiero_sdk_python.account.account_create_transaction.AccountCreateTransaction",
-            "cryptoDelete": "hiero_sdk_python.account.account_delete_transaction.AccountDeleteTransaction",
-            "cryptoDeleteLiveHash": None,  # Not implemented in SDK
-            "cryptoUpdateAccount": "hiero_sdk_python.account.account_update_transaction.AccountUpdateTransaction",
-            "fileAppend": "hiero_sdk_python.file.file_append_transaction.FileAppendTransaction",
-            "fileCreate": "hiero_sdk_python.file.file_create_transaction.FileCreateTransaction",
-            "fileDelete": "hiero_sdk_python.file.file_delete_transaction.FileDeleteTransaction",
-            "fileUpdate": "hiero_sdk_python.file.file_update_transaction.FileUpdateTransaction",
-            "systemDelete": None,  # Admin transaction
-            "systemUndelete": None,  # Admin transaction
-            "freeze": None,  # Admin transaction
-            "consensusCreateTopic": "hiero_sdk_python.consensus.topic_create_transaction.TopicCreateTransaction",
-            "consensusUpdateTopic": "hiero_sdk_python.consensus.topic_update_transaction.TopicUpdateTransaction",
-            "consensusDeleteTopic": "hiero_sdk_python.consensus.topic_delete_transaction.TopicDeleteTransaction",
-            "consensusSubmitMessage": "hiero_sdk_python.consensus.topic_message_submit_transaction.TopicMessageSubmitTransaction",
-            "tokenCreation": "hiero_sdk_python.tokens.token_create_transaction.TokenCreateTransaction",
-            "tokenFreeze": "hiero_sdk_python.tokens.token_freeze_transaction.TokenFreezeTransaction",
-            "tokenUnfreeze": "hiero_sdk_python.tokens.token_unfreeze_transaction.TokenUnfreezeTransaction",
-            "tokenGrantKyc": "hiero_sdk_python.tokens.token_grant_kyc_transaction.TokenGrantKycTransaction",
-            "tokenRevokeKyc": "hiero_sdk_python.tokens.token_revoke_kyc_transaction.TokenRevokeKycTransaction",
-            "tokenDeletion": "hiero_sdk_python.tokens.token_delete_transaction.TokenDeleteTransaction",
-            "tokenUpdate": "hiero_sdk_python.tokens.token_update_transaction.TokenUpdateTransaction",
-            "tokenMint": "hiero_sdk_python.tokens.token_mint_transaction.TokenMintTransaction",
-            "tokenBurn": "hiero_sdk_python.tokens.token_burn_transaction.TokenBurnTransaction",
-            "tokenWipe": "hiero_sdk_python.tokens.token_wipe_transaction.TokenWipeTransaction",
-            "tokenAssociate": "hiero_sdk_python.tokens.token_associate_transaction.TokenAssociateTransaction",
-            "tokenDissociate": "hiero_sdk_python.tokens.token_dissociate_transaction.TokenDissociateTransaction",
-            "tokenPause": "hiero_sdk_python.tokens.token_pause_transaction.TokenPauseTransaction",
-            "tokenUnpause": "hiero_sdk_python.tokens.token_pause_transaction.TokenUnpauseTransaction",
-            "scheduleCreate": "hiero_sdk_python.schedule.schedule_create_transaction.ScheduleCreateTransaction",
-            "scheduleDelete": "hiero_sdk_python.schedule.schedule_delete_transaction.ScheduleDeleteTransaction",
-            "scheduleSign": "hiero_sdk_python.schedule.schedule_sign_transaction.ScheduleSignTransaction",
-            "tokenFeeScheduleUpdate": None,  # Not commonly used
-            "tokenUpdateNfts": "hiero_sdk_python.tokens.token_update_nfts_transaction.TokenUpdateNftsTransaction",
-            "nodeCreate": "hiero_sdk_python.nodes.node_create_transaction.NodeCreateTransaction",
-            "nodeUpdate": "hiero_sdk_python.nodes.node_update_transaction.NodeUpdateTransaction",
-            "nodeDelete": "hiero_sdk_python.nodes.node_delete_transaction.NodeDeleteTransaction",
-            "registeredNodeCreate": "hiero_sdk_python.nodes.registered_node_create_transaction.RegisteredNodeCreateTransaction",
-            "registeredNodeUpdate": "hiero_sdk_python.nodes.registered_node_update_transaction.RegisteredNodeUpdateTransaction",
-            "registeredNodeDelete": "hiero_sdk_python.nodes.registered_node_delete_transaction.RegisteredNodeDeleteTransaction",
-            "utilPrng": "hiero_sdk_python.prng_transaction.PrngTransaction",
-            "tokenReject": "hiero_sdk_python.tokens.token_reject_transaction.TokenRejectTransaction",
-            "tokenAirdrop": "hiero_sdk_python.tokens.token_airdrop_transaction.TokenAirdropTransaction",
-            "tokenCancelAirdrop": "hiero_sdk_python.tokens.token_cancel_airdrop_transaction.TokenCancelAirdropTransaction",
-            "atomic_batch": "hiero_sdk_python.transaction.batch_transaction.BatchTransaction",
-        }
-
-        class_path = transaction_type_map.get(transaction_type)
+        class_path = _TRANSACTION_CLASS_PATHS.get(transaction_type)
 
         if class_path is None:
             return None
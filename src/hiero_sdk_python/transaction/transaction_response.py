@@ -8,6 +8,7 @@ Provides methods to retrieve the receipt and access core transaction details.
 
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING
 
 from hiero_sdk_python.account.account_id import AccountId
@@ -18,22 +19,66 @@ from hiero_sdk_python.transaction.transaction_record import TransactionRecord
 
 
 if TYPE_CHECKING:
+    from hiero_sdk_python.query.transaction_get_receipt_query import TransactionGetReceiptQuery
+    from hiero_sdk_python.query.transaction_record_query import TransactionRecordQuery
     from hiero_sdk_python.transaction.transaction import Transaction
 
 # pylint: disable=too-few-public-methods
 
 
+# The query modules are imported lazily to avoid a circular import; caching the class
+# keeps receipt polling loops from re-running the import machinery on every call.
+@cache
+def _receipt_query_class() -> type[TransactionGetReceiptQuery]:
+    from hiero_sdk_python.query.transaction_get_receipt_query import TransactionGetReceiptQuery
+
+    return TransactionGetReceiptQuery
+
+
+@cache
+def _record_query_class() -> type[TransactionRecordQuery]:
+    from hiero_sdk_python.query.transaction_record_query import TransactionRecordQuery
+
+    return TransactionRecordQuery
+
+
 class TransactionResponse:
     """Represents the response from a transaction submitted to the network."""
 
+    __slots__ = ("_transaction_id", "_node_id", "hash", "validate_status", "transaction")
+
     def __init__(self) -> None:
         """Initialize a new TransactionResponse instance with default values."""
-        self.transaction_id: TransactionId = TransactionId()
-        self.node_id: AccountId = AccountId()
+        # The default TransactionId/AccountId are only built if read before being assigned,
+        # since execute() always overwrites them.
+        self._transaction_id: TransactionId | None = None
+        self._node_id: AccountId | None = None
         self.hash: bytes = b""
         self.validate_status: bool = False
         self.transaction: Transaction | None = None
 
+    @property
+    def transaction_id(self) -> TransactionId:
+        """The ID of the submitted transaction."""
+        if self._transaction_id is None:
+            self._transaction_id = TransactionId()
+        return self._transaction_id
+
+    @transaction_id.setter
+    def transaction_id(self, transaction_id: TransactionId) -> None:
+        self._transaction_id = transaction_id
+
+    @property
+    def node_id(self) -> AccountId:
+        """The account ID of the node the transaction was submitted to."""
+        if self._node_id is None:
+            self._node_id = AccountId()
+        return self._node_id
+
+    @node_id.setter
+    def node_id(self, node_id: AccountId) -> None:
+        self._node_id = node_id
+
     def get_receipt_query(self, validate_status: bool = False):
         """
         Create a receipt query for this transaction.
@@ -44,10 +89,8 @@ class TransactionResponse:
         Returns:
             TransactionGetReceiptQuery: A configured receipt query.
         """
-        from hiero_sdk_python.query.transaction_get_receipt_query import TransactionGetReceiptQuery
-
         return (
-            TransactionGetReceiptQuery()
+            _receipt_query_class()()
             .set_transaction_id(self.transaction_id)
             .set_node_account_id(self.node_id)
             .set_validate_status(validate_status)
@@ -77,9 +120,7 @@ class TransactionResponse:
         Returns:
             TransactionRecordQuery: A configured record query.
         """
-        from hiero_sdk_python.query.transaction_record_query import TransactionRecordQuery
-
-        return TransactionRecordQuery().set_transaction_id(self.transaction_id).set_node_account_ids([self.node_id])
+        return _record_query_class()().set_transaction_id(self.transaction_id).set_node_account_ids([self.node_id])
 
     def get_record(self, client: Client, timeout: int | float | None = None) -> TransactionRecord:
         """
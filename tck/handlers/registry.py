@@ -8,6 +8,7 @@ import inspect
 import logging
 from collections.abc import Callable
 from dataclasses import asdict, fields as dc_fields
+from functools import cache
 from typing import Any, get_type_hints
 
 from tck.errors import JsonRpcError, handle_sdk_errors
@@ -42,6 +43,23 @@ def get_all_handlers() -> dict[str, Callable]:
     return _HANDLERS.copy()
 
 
+@cache
+def _get_param_type(handler: Callable) -> Any:
+    """Resolve the params type of a handler's first argument.
+
+    Handlers never change after registration, so the type hint and signature
+    lookups run once per handler instead of on every request.
+    """
+    target_func = getattr(handler, "__wrapped__", handler)
+
+    hints = get_type_hints(target_func)
+    signature = inspect.signature(handler)
+    parameters = list(signature.parameters.values())
+
+    param_name = parameters[0].name
+    return hints.get(param_name, parameters[0].annotation)
+
+
 def dispatch(method_name: str, params: Any) -> Any:
     """Dispatch the request to the appropriate handler based on method_name."""
     handler = get_handler(method_name)
@@ -53,16 +71,9 @@ def dispatch(method_name: str, params: Any) -> Any:
         raise JsonRpcError.method_not_found_error()
 
     try:
-        target_func = getattr(handler, "__wrapped__", handler)
-
-        hints = get_type_hints(target_func)
-        signature = inspect.signature(handler)
-        parameters = list(signature.parameters.values())
-
-        param_name = parameters[0].name
+        param_type = _get_param_type(handler)
 
         try:
-            param_type = hints.get(param_name, parameters[0].annotation)
             params = param_type.parse_json_params(params)
         except (TypeError, ValueError) as e:
             logger.error(f"InvalidParamsError (method: {repr(method_name)}) error: {str(e)}")
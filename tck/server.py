@@ -17,12 +17,19 @@ from tck.protocol import (
 )
 
 
+try:
+    from waitress import serve
+except ImportError:
+    serve = None
+
+
 @dataclass
 class ServerConfig:
     """Configuration for the TCK server."""
 
     host: str = field(default_factory=lambda: os.getenv("TCK_HOST", "localhost"))
     port: int = field(default_factory=lambda: _parse_port(os.getenv("TCK_PORT", "8544")))
+    threads: int = field(default_factory=lambda: _parse_threads(os.getenv("TCK_THREADS", "8")))
 
 
 def _parse_port(port_str: str) -> int:
@@ -35,6 +42,16 @@ def _parse_port(port_str: str) -> int:
     return port
 
 
+def _parse_threads(threads_str: str) -> int:
+    try:
+        threads = int(threads_str)
+    except ValueError as exc:
+        raise ValueError(f"TCK_THREADS must be a valid integer, got: '{threads_str}'") from exc
+    if threads < 1:
+        raise ValueError(f"TCK_THREADS must be at least 1, got: {threads}")
+    return threads
+
+
 app = Flask(__name__)
 logger = logging.getLogger(__name__)
 
@@ -73,11 +90,14 @@ def json_rpc_endpoint():
 
 
 def start_server(config: ServerConfig | None = None):
-    """Start the JSON-RPC server using Flask."""
+    """Start the JSON-RPC server, using waitress when it is installed and Flask's built-in server otherwise."""
     if config is None:
         config = ServerConfig()
     logger.info(f"Starting TCK server on {config.host}:{config.port}")
-    app.run(host=config.host, port=config.port)
+    if serve is not None:
+        serve(app, host=config.host, port=config.port, threads=config.threads)
+    else:
+        app.run(host=config.host, port=config.port, threaded=True)
 
 
 if __name__ == "__main__":
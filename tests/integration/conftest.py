@@ -5,9 +5,17 @@ import pytest
 from tests.integration.utils import IntegrationTestEnv
 
 
-@pytest.fixture
-def env():
-    """Integration test environment with client/operator set up."""
+@pytest.fixture(scope="session")
+def _session_env():
+    """Integration test environment shared by the whole session, so node channels are reused."""
     e = IntegrationTestEnv()
     yield e
     e.close()
+
+
+@pytest.fixture
+def env(_session_env):
+    """Integration test environment with client/operator set up."""
+    yield _session_env
+    # Some tests switch the operator to an account they created; restore it for the next test.
+    _session_env.client.set_operator(_session_env.operator_id, _session_env.operator_key)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from hiero_sdk_python.account.account_create_transaction import AccountCreateTransaction
@@ -21,11 +23,34 @@ from hiero_sdk_python.transaction.transaction_record import TransactionRecord
 from hiero_sdk_python.transaction.transaction_response import TransactionResponse
 
 
+CHUNKED_MESSAGE = b"A" * (1024 * 14)  # (1024 * 14) bytes ie 14 chunks
+
+
 def create_transaction():
     """Create a minimal valid AccountCreateTransaction for integration tests."""
     return AccountCreateTransaction().set_key_without_alias(PrivateKey.generate()).set_initial_balance(1)
 
 
+@pytest.fixture(scope="module")
+def executed_response(_session_env):
+    """Execute one transaction without waiting for its receipt, shared by the receipt/record tests."""
+    tx = create_transaction()
+    return tx, tx.execute(_session_env.client, wait_for_receipt=False)
+
+
+@pytest.fixture
+def topic_id(env):
+    """Create a fresh topic for a test and delete it afterwards."""
+    topic_receipt = TopicCreateTransaction(memo="Python SDK topic").execute(env.client)
+    assert topic_receipt.status == ResponseCode.SUCCESS, (
+        f"Topic creation failed: {ResponseCode(topic_receipt.status).name}"
+    )
+
+    yield topic_receipt.topic_id
+
+    TopicDeleteTransaction().set_topic_id(topic_receipt.topic_id).execute(env.client)
+
+
 @pytest.mark.integration
 def test_execute_waits_for_receipt(env):
     """Test execute return TransactionReceipt when wait_for_receipt is True (default)."""
@@ -51,10 +76,9 @@ def test_execute_without_wait_returns_transaction_response(env):
 
 
 @pytest.mark.integration
-def test_transaction_response_get_receipt(env):
+def test_transaction_response_get_receipt(env, executed_response):
     """Test transaction response return receipt for transaction response."""
-    tx = create_transaction()
-    response = tx.execute(env.client, wait_for_receipt=False)
+    tx, response = executed_response
 
     assert isinstance(response, TransactionResponse)
     assert response.transaction is tx
@@ -67,10 +91,9 @@ def test_transaction_response_get_receipt(env):
 
 
 @pytest.mark.integration
-def test_transaction_response_get_receipt_via_query(env):
+def test_transaction_response_get_receipt_via_query(env, executed_response):
     """Test transaction response return receipt query for transaction response."""
-    tx = create_transaction()
-    response = tx.execute(env.client, wait_for_receipt=False)
+    tx, response = executed_response
 
     assert isinstance(response, TransactionResponse)
     assert response.transaction is tx
@@ -78,8 +101,7 @@ def test_transaction_response_get_receipt_via_query(env):
     query = response.get_receipt_query()
     assert isinstance(query, TransactionGetReceiptQuery)
     assert query.transaction_id == tx.transaction_id
-    assert len(query.node_account_ids) == 1
-    assert query.node_account_ids[0] == response.node_id
+    assert query.node_account_ids == [response.node_id]
 
     receipt = query.execute(env.client)
     assert isinstance(receipt, TransactionReceipt)
@@ -89,10 +111,9 @@ def test_transaction_response_get_receipt_via_query(env):
 
 
 @pytest.mark.integration
-def test_get_receipt_vs_query_returns_same_receipt(env):
+def test_get_receipt_vs_query_returns_same_receipt(env, executed_response):
     """Verify that get_receipt and execute via get_receipt_query return the same result."""
-    tx = create_transaction()
-    response = tx.execute(env.client, wait_for_receipt=False)
+    tx, response = executed_response
 
     assert isinstance(response, TransactionResponse)
 
@@ -111,10 +132,9 @@ def test_get_receipt_vs_query_returns_same_receipt(env):
 
 
 @pytest.mark.integration
-def test_transaction_response_get_record(env):
+def test_transaction_response_get_record(env, executed_response):
     """Test transaction response return record for transaction response."""
-    tx = create_transaction()
-    response = tx.execute(env.client, wait_for_receipt=False)
+    tx, response = executed_response
 
     assert isinstance(response, TransactionResponse)
     assert response.transaction is tx
@@ -126,10 +146,9 @@ def test_transaction_response_get_record(env):
 
 
 @pytest.mark.integration
-def test_transaction_response_get_record_via_query(env):
+def test_transaction_response_get_record_via_query(env, executed_response):
     """Test transaction response return record query for transaction response."""
-    tx = create_transaction()
-    response = tx.execute(env.client, wait_for_receipt=False)
+    tx, response = executed_response
 
     assert isinstance(response, TransactionResponse)
     assert response.transaction is tx
@@ -137,8 +156,7 @@ def test_transaction_response_get_record_via_query(env):
     query = response.get_record_query()
     assert isinstance(query, TransactionRecordQuery)
     assert query.transaction_id == tx.transaction_id
-    assert len(query.node_account_ids) == 1
-    assert query.node_account_ids[0] == response.node_id
+    assert query.node_account_ids == [response.node_id]
 
     record = query.execute(env.client)
     assert isinstance(record, TransactionRecord)
@@ -147,10 +165,9 @@ def test_transaction_response_get_record_via_query(env):
 
 
 @pytest.mark.integration
-def test_get_record_vs_query_returns_same_record(env):
+def test_get_record_vs_query_returns_same_record(env, executed_response):
     """Verify that get_record and execute via get_record_query return the same result."""
-    tx = create_transaction()
-    response = tx.execute(env.client, wait_for_receipt=False)
+    tx, response = executed_response
 
     assert isinstance(response, TransactionResponse)
 
@@ -168,18 +185,12 @@ def test_get_record_vs_query_returns_same_record(env):
 
 
 @pytest.mark.integration
-def test_chunk_tx_returns_responses_without_wait_for_receipt(env):
+def test_chunk_tx_returns_responses_without_wait_for_receipt(env, topic_id):
     """Test chunk transaction return only response when execute without wait for receipt."""
-    topic_receipt = TopicCreateTransaction(memo="Python SDK topic").execute(env.client)
-    assert topic_receipt.status == ResponseCode.SUCCESS, (
-        f"Topic creation failed: {ResponseCode(topic_receipt.status).name}"
-    )
-
-    topic_id = topic_receipt.topic_id
-    message = "A" * (1024 * 14)  # message with (1024 * 14) bytes ie 14 chunks
-
     # Create a chunk transaction
-    message_tx = TopicMessageSubmitTransaction().set_topic_id(topic_id).set_message(message).freeze_with(env.client)
+    message_tx = (
+        TopicMessageSubmitTransaction().set_topic_id(topic_id).set_message(CHUNKED_MESSAGE).freeze_with(env.client)
+    )
 
     message_responses = message_tx.execute_all(env.client, wait_for_receipt=False)
 
@@ -188,31 +199,25 @@ def test_chunk_tx_returns_responses_without_wait_for_receipt(env):
     assert message_responses[0].transaction is message_tx
     assert message_responses[0].validate_status is True
 
-    # Verify topic_message receipt (i.e reach consensus)
-    for response in message_responses:
-        message_receipt = response.get_receipt(env.client)
+    # Verify topic_message receipt (i.e reach consensus), polling all chunks concurrently
+    with ThreadPoolExecutor(max_workers=len(message_responses)) as executor:
+        message_receipts = list(executor.map(lambda response: response.get_receipt(env.client), message_responses))
+
+    for message_receipt in message_receipts:
         assert message_receipt.status == ResponseCode.SUCCESS
 
     # Validates all chunks has been send
     info = TopicInfoQuery().set_topic_id(topic_id).execute(env.client)
     assert info.sequence_number == 14
 
-    TopicDeleteTransaction().set_topic_id(topic_id).execute(env.client)
-
 
 @pytest.mark.integration
-def test_chunk_tx_returns_receipts_with_wait_for_receipt(env):
+def test_chunk_tx_returns_receipts_with_wait_for_receipt(env, topic_id):
     """Test chunk transaction return only receipts when execute with wait for receipt."""
-    topic_receipt = TopicCreateTransaction(memo="Python SDK topic").execute(env.client)
-    assert topic_receipt.status == ResponseCode.SUCCESS, (
-        f"Topic creation failed: {ResponseCode(topic_receipt.status).name}"
-    )
-
-    topic_id = topic_receipt.topic_id
-    message = "A" * (1024 * 14)  # message with (1024 * 14) bytes ie 14 chunks
-
     # Create a chunk transaction
-    message_tx = TopicMessageSubmitTransaction().set_topic_id(topic_id).set_message(message).freeze_with(env.client)
+    message_tx = (
+        TopicMessageSubmitTransaction().set_topic_id(topic_id).set_message(CHUNKED_MESSAGE).freeze_with(env.client)
+    )
 
     message_receipt = message_tx.execute_all(env.client, wait_for_receipt=True)
 
@@ -227,8 +232,6 @@ def test_chunk_tx_returns_receipts_with_wait_for_receipt(env):
     info = TopicInfoQuery().set_topic_id(topic_id).execute(env.client)
     assert info.sequence_number == 14
 
-    TopicDeleteTransaction().set_topic_id(topic_id).execute(env.client)
-
 
 @pytest.mark.integration
 def test_get_receipt_returns_failed_status_by_default(env):
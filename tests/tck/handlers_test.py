@@ -155,6 +155,22 @@ class TestDispatch:
 
         assert result == {"value": 1, "other": "value"}, "Dispatch failed"
 
+    def test_dispatch_resolves_param_type_once(self, monkeypatch):
+        """Repeated dispatches reuse the handler's resolved params type."""
+
+        @rpc_method("setup")
+        def handler(_params: DummyParams):
+            return DummyResult(value=1)
+
+        hints = MagicMock(wraps=registry.get_type_hints)
+        monkeypatch.setattr(registry, "get_type_hints", hints)
+        registry._get_param_type.cache_clear()
+
+        for _ in range(3):
+            assert dispatch("setup", {}) == {"value": 1}
+
+        hints.assert_called_once()
+
     def test_dispatch_unknown_method(self):
         """Unknown method should raise METHOD_NOT_FOUND."""
         with pytest.raises(JsonRpcError) as excinfo:
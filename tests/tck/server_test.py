@@ -0,0 +1,54 @@
+"""Unit tests for starting the TCK server."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tck import server
+from tck.server import ServerConfig, start_server
+
+
+pytestmark = pytest.mark.unit
+
+
+def test_start_server_uses_waitress_when_installed():
+    """Test the server is served by waitress when it is available."""
+    config = ServerConfig(host="127.0.0.1", port=9000)
+    mock_serve = MagicMock()
+
+    with patch.object(server, "serve", mock_serve), patch.object(server.app, "run") as mock_run:
+        start_server(config)
+
+    mock_serve.assert_called_once_with(server.app, host="127.0.0.1", port=9000, threads=config.threads)
+    mock_run.assert_not_called()
+
+
+def test_start_server_falls_back_to_flask():
+    """Test the server falls back to Flask's threaded server without waitress."""
+    config = ServerConfig(host="127.0.0.1", port=9000)
+
+    with patch.object(server, "serve", None), patch.object(server.app, "run") as mock_run:
+        start_server(config)
+
+    mock_run.assert_called_once_with(host="127.0.0.1", port=9000, threaded=True)
+
+
+def test_server_config_reads_threads_from_env(monkeypatch):
+    """Test the waitress thread count can be set with TCK_THREADS."""
+    monkeypatch.setenv("TCK_THREADS", "16")
+
+    assert ServerConfig().threads == 16
+
+
+@pytest.mark.parametrize(
+    "value, message",
+    [("many", "TCK_THREADS must be a valid integer"), ("0", "TCK_THREADS must be at least 1")],
+)
+def test_server_config_rejects_invalid_threads(monkeypatch, value, message):
+    """Test invalid TCK_THREADS values are rejected."""
+    monkeypatch.setenv("TCK_THREADS", value)
+
+    with pytest.raises(ValueError, match=message):
+        ServerConfig()
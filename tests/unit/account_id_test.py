@@ -115,6 +115,19 @@ def test_str_representation_default(account_id_100):
     assert str(account_id_100) == "0.0.100"
 
 
+def test_str_and_repr_are_cached_until_fields_change(account_id_100, alias_key):
+    """str() and repr() reuse the cached text and rebuild it after a field is reassigned."""
+    assert str(account_id_100) is str(account_id_100)
+    assert repr(account_id_100) is repr(account_id_100)
+
+    account_id_100.num = 200
+    assert str(account_id_100) == "0.0.200"
+    assert repr(account_id_100) == "AccountId(shard=0, realm=0, num=200)"
+
+    account_id_100.alias_key = alias_key
+    assert str(account_id_100) == f"0.0.{alias_key.to_string()}"
+
+
 def test_str_representation_with_checksum(client, account_id_100):
     """Test string representation of AccountId with checksum."""
     assert account_id_100.to_string_with_checksum(client) == "0.0.100-hhghj"
@@ -258,6 +271,19 @@ def test_from_string_with_alias(request, alias_fixture):
         assert account_id.evm_address is None
 
 
+def test_from_string_reuses_parse_but_not_instances():
+    """Repeated from_string calls share the cached parse but return independent instances."""
+    first = AccountId.from_string("0.0.4242-abcde")
+    second = AccountId.from_string("0.0.4242-abcde")
+
+    assert first == second
+    assert first is not second
+    assert second.checksum == "abcde"
+
+    first.num = 1
+    assert second.num == 4242
+
+
 @pytest.mark.parametrize(
     "input_str,expected",
     [
@@ -266,6 +292,8 @@ def test_from_string_with_alias(request, alias_fixture):
         ("0x123", False),  # too short
         ("1234567890abcdef1234567890abcdef1234567890", False),  # too long
         ("0xZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZZ", False),  # invalid hex
+        ("0x1234567890abcdef1234567890abcdef12345678\n", False),  # trailing newline
+        ("1234 567890abcdef1234567890abcdef1234567", False),  # embedded whitespace
     ],
 )
 def test_is_evm_address(input_str, expected):
@@ -902,6 +930,17 @@ def test_to_bytes_and_from_bytes_with_evm_address(evm_address):
     assert new_account_id.evm_address == account_id.evm_address
 
 
+def test_to_bytes_and_to_evm_address_are_cached_until_fields_change():
+    """to_bytes() and to_evm_address() reuse cached results and recompute after a field is reassigned."""
+    account_id = AccountId(0, 0, 100)
+    assert account_id.to_bytes() is account_id.to_bytes()
+    assert account_id.to_evm_address() is account_id.to_evm_address()
+
+    account_id.num = 200
+    assert account_id.to_bytes() == AccountId(0, 0, 200).to_bytes()
+    assert account_id.to_evm_address() == AccountId(0, 0, 200).to_evm_address()
+
+
 def test_to_evm_address_returns_existing_evm_address(evm_address):
     """Test to_evm_address returns stored evm_address if present."""
     account_id = AccountId(shard=0, realm=0, num=0, evm_address=evm_address)
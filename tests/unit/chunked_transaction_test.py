@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -167,6 +167,35 @@ def test_execute_all_multi_chunk_replays_each_chunk(mock_client, private_key):
     assert tx._current_chunk_index == 2
 
 
+def test_execute_all_waits_for_each_chunk_receipt_by_default(mock_client):
+    tx = DummyChunkedTransaction(required_chunks=2)
+    tx.freeze_with(mock_client)
+
+    with patch.object(Transaction, "execute", side_effect=["receipt-1", "receipt-2"]) as mock_execute:
+        receipts = tx.execute_all(mock_client)
+
+    assert receipts == ["receipt-1", "receipt-2"]
+    assert [call.kwargs["wait_for_receipt"] for call in mock_execute.call_args_list] == [True, True]
+
+
+def test_execute_all_unordered_chunks_collect_receipts_after_submission(mock_client):
+    tx = DummyChunkedTransaction(required_chunks=3)
+    tx._requires_ordered_chunks = lambda: False
+    tx.freeze_with(mock_client)
+
+    responses = [MagicMock() for _ in range(3)]
+    for index, response in enumerate(responses):
+        response.get_receipt.return_value = f"receipt-{index + 1}"
+
+    with patch.object(Transaction, "execute", side_effect=responses) as mock_execute:
+        receipts = tx.execute_all(mock_client, validate_status=True)
+
+    assert receipts == ["receipt-1", "receipt-2", "receipt-3"]
+    assert [call.kwargs["wait_for_receipt"] for call in mock_execute.call_args_list] == [False, False, False]
+    for response in responses:
+        response.get_receipt.assert_called_once_with(mock_client, timeout=None, validate_status=True)
+
+
 def test_validate_chunking_allows_required_equal_to_max_chunks():
     """Test that _validate_chunking does not raise an error when required_chunks equals max_chunks."""
     tx = DummyChunkedTransaction(required_chunks=3).set_max_chunks(3)
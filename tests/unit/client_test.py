@@ -531,6 +531,22 @@ def test_get_node_account_ids_raises_when_no_nodes():
     client.close()
 
 
+def test_client_sharing_network_reuses_node_channels():
+    """Test that a second Client built on an existing Network reuses its open node channels."""
+    node = _Node(AccountId(0, 0, 3), "127.0.0.1:50211", None)
+    network = Network(nodes=[node])
+    network.set_transport_security(False)
+    client = Client(network)
+    channel = node._get_channel()
+
+    secondary_client = Client(network=client.network)
+
+    assert secondary_client.network is client.network
+    assert secondary_client.network.nodes[0]._get_channel() is channel
+
+    client.close()
+
+
 def test_for_network_initializes_with_custom_map():
     """Test for_network correctly maps strings to AccountIds and Nodes."""
     network_map = {"127.0.0.1:50211": AccountId(0, 0, 3), "127.0.0.1:50212": AccountId(0, 0, 4)}
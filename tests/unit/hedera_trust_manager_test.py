@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import hashlib
+import hmac
+from unittest.mock import patch
 
 import pytest
 
@@ -68,6 +70,27 @@ def test_trust_manager_check_server_trusted_mismatched_hash():
         trust_manager.check_server_trusted(pem_cert)
 
 
+def test_trust_manager_check_server_trusted_matching_uppercase_prefixed_hash():
+    """Test certificate validation accepts a 0x-prefixed uppercase hex hash."""
+    pem_cert = b"-----BEGIN CERTIFICATE-----\nTEST_CERT\n-----END CERTIFICATE-----\n"
+    cert_hash_hex = "0x" + hashlib.sha384(pem_cert).hexdigest().upper()
+
+    trust_manager = _HederaTrustManager(cert_hash_hex.encode("utf-8"), verify_certificate=True)
+    assert trust_manager._expected_digest == hashlib.sha384(pem_cert).digest()
+    assert trust_manager.check_server_trusted(pem_cert) is True
+
+
+def test_trust_manager_check_server_trusted_uses_constant_time_compare():
+    """Test certificate validation compares digests with hmac.compare_digest."""
+    pem_cert = b"-----BEGIN CERTIFICATE-----\nTEST_CERT\n-----END CERTIFICATE-----\n"
+    trust_manager = _HederaTrustManager(hashlib.sha384(pem_cert).hexdigest().encode("utf-8"), verify_certificate=True)
+
+    with patch("hmac.compare_digest", wraps=hmac.compare_digest) as mock_compare:
+        assert trust_manager.check_server_trusted(pem_cert) is True
+
+    mock_compare.assert_called_once_with(hashlib.sha384(pem_cert).digest(), trust_manager._expected_digest)
+
+
 def test_trust_manager_check_server_trusted_no_verification():
     """Test certificate validation skipped when verification disabled."""
     pem_cert = b"-----BEGIN CERTIFICATE-----\nTEST_CERT\n-----END CERTIFICATE-----\n"
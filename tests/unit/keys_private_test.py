@@ -409,6 +409,18 @@ def test_public_key_roundtrip_der_and_raw():
     assert pub2.to_string_ecdsa() == pub.to_string_ecdsa()
 
 
+@pytest.mark.parametrize("key_type", ["ed25519", "ecdsa"])
+def test_public_key_is_derived_once(key_type):
+    """
+    Test that repeated public_key() calls return the cached derived key.
+    """
+    priv = PrivateKey.generate(key_type)
+    pub = priv.public_key()
+
+    assert priv.public_key() is pub
+    assert pub.to_bytes_raw() == PublicKey(priv._private_key.public_key()).to_bytes_raw()
+
+
 @pytest.mark.parametrize("key_type", ["ed25519", "ecdsa"])
 def test_repr_contains_full_hex(key_type):
     """
@@ -27,6 +27,19 @@ def test_get_level():
     assert logger.get_level() == LogLevel.ERROR
 
 
+def test_is_enabled_for():
+    """Test is_enabled_for reflects the current level and silent mode."""
+    logger = Logger(LogLevel.INFO, "test_is_enabled_for")
+    assert logger.is_enabled_for(LogLevel.ERROR)
+    assert not logger.is_enabled_for(LogLevel.TRACE)
+
+    logger.set_level(LogLevel.TRACE)
+    assert logger.is_enabled_for(LogLevel.TRACE)
+
+    logger.set_silent(True)
+    assert not logger.is_enabled_for(LogLevel.ERROR)
+
+
 def test_logger_creation():
     logger = Logger(LogLevel.DEBUG, "test_logger")
     assert logger.name == "test_logger"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import threading
+from collections import deque
 from concurrent import futures
 from contextlib import contextmanager
 
@@ -33,7 +34,8 @@ class MockServer:
         Args:
             responses (list): List of response objects to return in sequence
         """
-        self.responses = responses
+        # Responses are served in order across all services, so a single FIFO is shared.
+        self.responses = deque(responses)
         self._lock = threading.Lock()
         self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
 
@@ -111,7 +113,7 @@ class MockServer:
                         if not responses:
                             return None
 
-                        response = responses.pop(0)
+                        response = responses.popleft()
 
                     if isinstance(response, RealRpcError):
                         # Abort with custom error
@@ -11,12 +11,21 @@ import pytest
 from src.hiero_sdk_python.account.account_id import AccountId
 from src.hiero_sdk_python.address_book.endpoint import Endpoint
 from src.hiero_sdk_python.address_book.node_address import NodeAddress
-from src.hiero_sdk_python.node import _Node
+from src.hiero_sdk_python.client.network import Network
+from src.hiero_sdk_python.node import _cert_fetch_context, _der_to_pem_bytes, _HederaTrustManager, _Node
 
 
 pytestmark = pytest.mark.unit
 
 
+@pytest.fixture(autouse=True)
+def reset_cert_fetch_context():
+    """Drop the shared TLS context so patched ssl.create_default_context calls take effect."""
+    _cert_fetch_context.cache_clear()
+    yield
+    _cert_fetch_context.cache_clear()
+
+
 @pytest.fixture
 def mock_address_book():
     """Create a mock address book with certificate hash."""
@@ -67,6 +76,17 @@ def test_node_apply_transport_security_disable(mock_node_with_address_book):
     assert node._address._get_port() == 50211
 
 
+def test_node_address_change_refreshes_cached_target(mock_node_without_address_book):
+    """Replacing the address keeps the cached TLS flag and channel target in sync."""
+    node = mock_node_without_address_book
+    assert node._is_tls is False
+    assert node._target == "127.0.0.1:50211"
+
+    node._apply_transport_security(True)
+    assert node._is_tls is True
+    assert node._target == "127.0.0.1:50212"
+
+
 def test_node_apply_transport_security_idempotent(mock_node_without_address_book):
     """Test that applying same TLS state is idempotent."""
     node = mock_node_without_address_book
@@ -136,13 +156,13 @@ def test_node_build_channel_options_no_override_when_same():
     node = _Node(AccountId(0, 0, 3), "node.example.com:50212", address_book)
 
     options = node._build_channel_options()
-    assert options == [
+    assert options == (
         ("grpc.default_authority", "127.0.0.1"),
         ("grpc.ssl_target_name_override", "127.0.0.1"),
         ("grpc.keepalive_time_ms", 100000),
         ("grpc.keepalive_timeout_ms", 10000),
         ("grpc.keepalive_permit_without_calls", 1),
-    ]
+    )
 
 
 def test_node_build_channel_options_override_localhost_without_address_book(
@@ -151,13 +171,13 @@ def test_node_build_channel_options_override_localhost_without_address_book(
     """Test channel options don't include override without address book."""
     node = mock_node_without_address_book
     options = node._build_channel_options()
-    assert options == [
+    assert options == (
         ("grpc.default_authority", "127.0.0.1"),
         ("grpc.ssl_target_name_override", "127.0.0.1"),
         ("grpc.keepalive_time_ms", 100000),
         ("grpc.keepalive_timeout_ms", 10000),
         ("grpc.keepalive_permit_without_calls", 1),
-    ]
+    )
 
 
 @patch("socket.create_connection")
@@ -174,14 +194,36 @@ def test_node_fetch_server_certificate_pem(mock_ssl_context, mock_socket_conn, m
     mock_sock = MagicMock()
     mock_socket_conn.return_value.__enter__.return_value = mock_sock
 
-    # Mock DER to PEM conversion
-    with patch(
-        "ssl.DER_cert_to_PEM_cert",
-        return_value="-----BEGIN CERTIFICATE-----\nPEM\n-----END CERTIFICATE-----\n",
-    ):
-        pem_cert = node._fetch_server_certificate_pem()
-        assert isinstance(pem_cert, bytes)
-        assert b"BEGIN CERTIFICATE" in pem_cert
+    pem_cert = node._fetch_server_certificate_pem()
+
+    assert pem_cert == _der_to_pem_bytes(b"DER_CERT")
+    assert b"BEGIN CERTIFICATE" in pem_cert
+
+
+@patch("socket.create_connection")
+@patch("ssl.create_default_context")
+def test_fetch_server_certificate_reuses_tls_context(mock_ssl_context, mock_socket_conn, mock_node_with_address_book):
+    """The TLS context is created once and shared across certificate fetches."""
+    mock_context = MagicMock()
+    mock_ssl_context.return_value = mock_context
+    mock_context.wrap_socket.return_value.__enter__.return_value.getpeercert.return_value = b"DER_CERT"
+    mock_socket_conn.return_value.__enter__.return_value = MagicMock()
+
+    first = mock_node_with_address_book._fetch_server_certificate_pem()
+    second = _Node(AccountId(0, 0, 4), "127.0.0.2:50212", Mock())._fetch_server_certificate_pem()
+
+    assert b"BEGIN CERTIFICATE" in first
+    assert second == first
+    mock_ssl_context.assert_called_once()
+    assert mock_context.wrap_socket.call_count == 2
+
+
+@pytest.mark.parametrize("size", [0, 1, 47, 48, 49, 96, 1234])
+def test_der_to_pem_bytes_matches_ssl_encoding(size):
+    """_der_to_pem_bytes must be byte-identical to ssl.DER_cert_to_PEM_cert so pinned hashes match."""
+    der_cert = bytes(range(256)) * 5
+    der_cert = der_cert[:size]
+    assert _der_to_pem_bytes(der_cert) == ssl.DER_cert_to_PEM_cert(der_cert).encode("utf-8")
 
 
 def test_node_validate_tls_certificate_with_trust_manager(mock_node_with_address_book):
@@ -404,9 +446,144 @@ def test_fetch_server_certificate_legacy_tls_path(mock_ssl_context, mock_socket)
     mock_context.wrap_socket.return_value.__enter__.return_value = mock_tls_socket
     mock_socket.return_value.__enter__.return_value = MagicMock()
 
-    with patch("ssl.DER_cert_to_PEM_cert", return_value="PEM"):
-        node._fetch_server_certificate_pem()
+    pem_cert = node._fetch_server_certificate_pem()
 
+    assert b"BEGIN CERTIFICATE" in pem_cert
     # Assert legacy flags applied
     assert mock_context.options & ssl.OP_NO_TLSv1
     assert mock_context.options & ssl.OP_NO_TLSv1_1
+
+
+def test_prefetch_certificates_is_used_by_get_channel(mock_address_book):
+    """Prefetched certificates are consumed by the next _get_channel call instead of a new fetch."""
+    nodes = [_Node(AccountId(0, 0, num), f"127.0.0.{num}:50212", mock_address_book) for num in (3, 4)]
+    for node in nodes:
+        node._verify_certificates = False
+
+    with patch.object(_Node, "_fetch_server_certificate_pem", autospec=True, return_value=b"prefetched") as mock_fetch:
+        _Node._prefetch_certificates(nodes)
+        assert mock_fetch.call_count == 2
+
+        with patch("grpc.secure_channel"):
+            nodes[0]._get_channel()
+
+    assert mock_fetch.call_count == 2
+    assert nodes[0]._node_pem_cert == b"prefetched"
+    assert nodes[1]._fetched_pem_cert == b"prefetched"
+
+
+def test_prefetch_certificates_skips_unreachable_and_ineligible_nodes(mock_address_book):
+    """Fetch failures are left to the lazy path and nodes that need no fetch are not contacted."""
+    unreachable = _Node(AccountId(0, 0, 3), "127.0.0.1:50212", mock_address_book)
+    insecure = _Node(AccountId(0, 0, 4), "127.0.0.1:50211", mock_address_book)
+    with_root = _Node(AccountId(0, 0, 5), "127.0.0.1:50212", mock_address_book)
+    with_root._set_root_certificates(b"root")
+
+    with patch.object(_Node, "_fetch_server_certificate_pem", autospec=True, side_effect=OSError) as mock_fetch:
+        _Node._prefetch_certificates([unreachable, insecure, with_root])
+
+    mock_fetch.assert_called_once_with(unreachable)
+    assert unreachable._fetched_pem_cert is None
+
+
+def test_prefetch_certificates_includes_nodes_without_address_book(mock_node_without_address_book):
+    """Nodes without an address book are fetched too, as _get_channel would fetch for them."""
+    node = mock_node_without_address_book
+    node._apply_transport_security(True)
+
+    with patch.object(_Node, "_fetch_server_certificate_pem", autospec=True, return_value=b"fetched") as mock_fetch:
+        _Node._prefetch_certificates([node])
+
+    mock_fetch.assert_called_once_with(node)
+    assert node._fetched_pem_cert == b"fetched"
+
+
+def test_get_channel_reuses_fetched_certificate_after_close(mock_node_with_address_book):
+    """Rebuilding a channel reuses the certificate fetched for the previous one."""
+    node = mock_node_with_address_book
+    node._verify_certificates = False
+
+    with (
+        patch("grpc.secure_channel"),
+        patch.object(node, "_fetch_server_certificate_pem", return_value=b"dummy-cert") as mock_fetch,
+    ):
+        node._get_channel()
+        node._close()
+        node._get_channel()
+
+    mock_fetch.assert_called_once()
+    assert node._node_pem_cert == b"dummy-cert"
+
+
+def test_get_channel_refetches_after_certificate_mismatch(mock_address_book):
+    """A fetched certificate that fails pinning is not kept, so the next channel fetches again."""
+    pem_cert = b"-----BEGIN CERTIFICATE-----\nGOOD\n-----END CERTIFICATE-----\n"
+    mock_address_book._cert_hash = hashlib.sha384(pem_cert).hexdigest().encode("utf-8")
+    node = _Node(AccountId(0, 0, 3), "127.0.0.1:50212", mock_address_book)
+
+    with (
+        patch("grpc.secure_channel"),
+        patch.object(node, "_fetch_server_certificate_pem", side_effect=[b"tampered", pem_cert]) as mock_fetch,
+    ):
+        with pytest.raises(ValueError, match="Failed to confirm the server's certificate"):
+            node._get_channel()
+        assert node._fetched_pem_cert is None
+
+        node._get_channel()
+
+    assert mock_fetch.call_count == 2
+    assert node._fetched_pem_cert == pem_cert
+
+
+def test_network_close_drops_fetched_certificates(mock_node_with_address_book):
+    """Closing the network forgets fetched certificates so reconnecting fetches them again."""
+    node = mock_node_with_address_book
+    network = Network(nodes=[node])
+    network.set_verify_certificates(False)
+
+    with (
+        patch("grpc.secure_channel"),
+        patch.object(node, "_fetch_server_certificate_pem", side_effect=[b"old-cert", b"new-cert"]) as mock_fetch,
+    ):
+        node._get_channel()
+        network._close()
+        node._get_channel()
+
+    assert mock_fetch.call_count == 2
+    assert node._node_pem_cert == b"new-cert"
+
+
+def test_prefetch_certificates_discards_certificate_with_wrong_hash(mock_address_book):
+    """A prefetched certificate that fails hash pinning is not kept for _get_channel."""
+    pem_cert = b"-----BEGIN CERTIFICATE-----\nGOOD\n-----END CERTIFICATE-----\n"
+    mock_address_book._cert_hash = hashlib.sha384(pem_cert).hexdigest().encode("utf-8")
+    trusted = _Node(AccountId(0, 0, 3), "127.0.0.1:50212", mock_address_book)
+    untrusted = _Node(AccountId(0, 0, 4), "127.0.0.2:50212", mock_address_book)
+
+    with (
+        patch.object(trusted, "_fetch_server_certificate_pem", return_value=pem_cert),
+        patch.object(untrusted, "_fetch_server_certificate_pem", return_value=b"tampered"),
+    ):
+        _Node._prefetch_certificates([trusted, untrusted])
+
+    assert trusted._fetched_pem_cert == pem_cert
+    assert untrusted._fetched_pem_cert is None
+
+
+def test_validate_tls_certificate_skips_already_validated_certificate(mock_node_with_address_book):
+    """Revalidating the same certificate against the same hash does not rebuild the trust manager."""
+    node = mock_node_with_address_book
+    pem_cert = b"-----BEGIN CERTIFICATE-----\nTEST\n-----END CERTIFICATE-----\n"
+    node._address_book._cert_hash = hashlib.sha384(pem_cert).hexdigest().encode("utf-8")
+    node._node_pem_cert = pem_cert
+
+    with patch("src.hiero_sdk_python.node._HederaTrustManager", wraps=_HederaTrustManager) as mock_trust_manager:
+        node._validate_tls_certificate_with_trust_manager()
+        node._validate_tls_certificate_with_trust_manager()
+
+        # A different address book hash must be checked again
+        node._address_book._cert_hash = b"0" * 96
+        with pytest.raises(ValueError, match="Failed to confirm the server's certificate"):
+            node._validate_tls_certificate_with_trust_manager()
+
+    assert mock_trust_manager.call_count == 2
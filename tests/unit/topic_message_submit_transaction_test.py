@@ -228,8 +228,8 @@ def test_topic_message_submit_transaction_with_large_message(topic_id):
     )
 
     # For simplicity, assume 4 chunks are required
-    # All chunks go to the same node, so repeat the same responses for that node
-    response_sequence = [tx_response, receipt_response] * 4  # 4 chunks
+    # All chunks go to the same node and are submitted before any receipt is requested
+    response_sequence = [tx_response] * 4 + [receipt_response] * 4  # 4 chunks
 
     with mock_hedera_servers([response_sequence]) as client:
         tx = TopicMessageSubmitTransaction().set_topic_id(topic_id).set_message(large_message).freeze_with(client)
@@ -259,8 +259,8 @@ def test_topic_message_submit_execute_all_multi_chunk_success(topic_id):
     )
 
     # For simplicity, assume 4 chunks are required
-    # All chunks go to the same node, so repeat the same responses for that node
-    response_sequence = [tx_response, receipt_response] * 4  # 4 chunks
+    # All chunks go to the same node and are submitted before any receipt is requested
+    response_sequence = [tx_response] * 4 + [receipt_response] * 4  # 4 chunks
 
     with mock_hedera_servers([response_sequence]) as client:
         tx = TopicMessageSubmitTransaction().set_topic_id(topic_id).set_message(large_message).freeze_with(client)
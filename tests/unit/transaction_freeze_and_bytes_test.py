@@ -8,6 +8,8 @@ and expected behavior.
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
 from hiero_sdk_python.account.account_id import AccountId
@@ -685,3 +687,27 @@ def test_map_response_raises_if_proto_request_is_not_transaction():
             node_id=mock_node_id,
             proto_request=invalid_proto_request,
         )
+
+
+def test_multi_node_freeze_builds_body_once():
+    """Test freeze() builds the body once and only swaps nodeAccountID for the other nodes."""
+    operator_id = AccountId(0, 0, 1234)
+    node_account_ids = [AccountId(0, 0, 3), AccountId(0, 0, 4), AccountId(0, 0, 5)]
+    transaction_id = TransactionId.generate(operator_id)
+
+    tx = TransferTransaction().add_hbar_transfer(operator_id, -1).add_hbar_transfer(AccountId(0, 0, 5678), 1)
+    tx.set_transaction_id(transaction_id)
+    tx.set_node_account_ids(node_account_ids)
+
+    original = TransferTransaction.build_transaction_body
+    with patch.object(TransferTransaction, "build_transaction_body", autospec=True, side_effect=original) as build:
+        tx.freeze()
+
+    assert build.call_count == 1
+
+    for node_account_id in node_account_ids:
+        expected = TransferTransaction().add_hbar_transfer(operator_id, -1).add_hbar_transfer(AccountId(0, 0, 5678), 1)
+        expected.set_transaction_id(transaction_id)
+        expected.node_account_id = node_account_id
+
+        assert tx._transaction_body_bytes[node_account_id] == expected.build_transaction_body().SerializeToString()
@@ -54,8 +54,7 @@ def test_get_receipt_query_builds_query(transaction_response):
 
     assert isinstance(query, TransactionGetReceiptQuery)
     assert query.transaction_id == transaction_response.transaction_id
-    assert len(query.node_account_ids) == 1
-    assert query.node_account_ids[0] == transaction_response.node_id
+    assert query.node_account_ids == [transaction_response.node_id]
 
 
 def test_get_receipt_executes_and_returns_receipt(transaction_response):
@@ -89,8 +88,7 @@ def test_get_receipt_query_set_validate_status(transaction_response):
     assert isinstance(query, TransactionGetReceiptQuery)
     assert query.validate_status is True
     assert query.transaction_id == transaction_response.transaction_id
-    assert len(query.node_account_ids) == 1
-    assert query.node_account_ids[0] == transaction_response.node_id
+    assert query.node_account_ids == [transaction_response.node_id]
 
 
 def test_get_receipt_returns_failure_status_without_validate_status(
@@ -137,8 +135,7 @@ def test_get_record_query_builds_query(transaction_response):
 
     assert isinstance(query, TransactionRecordQuery)
     assert query.transaction_id == transaction_response.transaction_id
-    assert len(query.node_account_ids) == 1
-    assert query.node_account_ids[0] == transaction_response.node_id
+    assert query.node_account_ids == [transaction_response.node_id]
 
 
 def test_get_record_executes_and_returns_record(transaction_response):
@@ -210,6 +207,19 @@ def test_transaction_response_fields(transaction_id):
     assert resp.node_id == AccountId(0, 0, 3)
 
 
+def test_transaction_response_defaults_are_built_lazily():
+    """Default transaction_id and node_id are only created when read before being assigned."""
+    resp = TransactionResponse()
+
+    assert resp._transaction_id is None
+    assert resp._node_id is None
+
+    assert isinstance(resp.transaction_id, TransactionId)
+    assert resp.node_id == AccountId()
+    assert resp.transaction_id is resp.transaction_id
+    assert resp.node_id is resp.node_id
+
+
 def test_transaction_response_get_receipt_is_pinned_to_submitting_node(
     transaction_id,
 ):
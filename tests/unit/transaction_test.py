@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
 from hiero_sdk_python.account.account_create_transaction import AccountCreateTransaction
@@ -51,7 +53,19 @@ def transaction_id():
     return TransactionId.from_string("0.0.9@1770911831.331000137")
 
 
-def test_execute_waits_for_receipt_receipt():
+@pytest.fixture(scope="module")
+def account_key():
+    """Returns a private key shared by the tests in this module."""
+    return PrivateKey.generate()
+
+
+@pytest.fixture
+def account_create_tx(account_key):
+    """Returns a minimal, unfrozen AccountCreateTransaction for execute tests."""
+    return AccountCreateTransaction().set_initial_balance(1).set_key_without_alias(account_key)
+
+
+def test_execute_waits_for_receipt_receipt(account_create_tx):
     """Test execute return TransactionReceipt when wait_for_receipt is True (default)."""
     ok_response = transaction_response_pb2.TransactionResponse(nodeTransactionPrecheckCode=ResponseCode.OK)
 
@@ -68,7 +82,7 @@ def test_execute_waits_for_receipt_receipt():
     response_sequence = [[ok_response, receipt_response]]
 
     with mock_hedera_servers(response_sequence) as client:
-        tx = AccountCreateTransaction().set_initial_balance(1).set_key_without_alias(PrivateKey.generate())
+        tx = account_create_tx
 
         # Default value of wait_for_receipt = True
         receipt = tx.execute(client, wait_for_receipt=True)
@@ -77,7 +91,7 @@ def test_execute_waits_for_receipt_receipt():
         assert receipt.status == ResponseCode.SUCCESS
 
 
-def test_execute_without_wait_returns_transaction_response():
+def test_execute_without_wait_returns_transaction_response(account_create_tx):
     """Test execute return TransactionResponse when wait_for_receipt is False."""
     ok_response = transaction_response_pb2.TransactionResponse(nodeTransactionPrecheckCode=ResponseCode.OK)
 
@@ -94,7 +108,7 @@ def test_execute_without_wait_returns_transaction_response():
     response_sequence = [[ok_response, receipt_response]]
 
     with mock_hedera_servers(response_sequence) as client:
-        tx = AccountCreateTransaction().set_initial_balance(1).set_key_without_alias(PrivateKey.generate())
+        tx = account_create_tx
 
         # Explicitly pass wait_for_receipt=False to get TransactionResponse
         response = tx.execute(client, wait_for_receipt=False)
@@ -105,7 +119,7 @@ def test_execute_without_wait_returns_transaction_response():
         assert response.validate_status is True
 
 
-def test_execute_raises_error_when_validation_enabled_and_transaction_fails():
+def test_execute_raises_error_when_validation_enabled_and_transaction_fails(account_create_tx):
     """Test execute raises error for failing transactions when validate_status is True."""
     ok_response = transaction_response_pb2.TransactionResponse(nodeTransactionPrecheckCode=ResponseCode.OK)
 
@@ -119,7 +133,7 @@ def test_execute_raises_error_when_validation_enabled_and_transaction_fails():
     response_sequence = [[ok_response, receipt_response]]
 
     with mock_hedera_servers(response_sequence) as client:
-        tx = AccountCreateTransaction().set_initial_balance(1).set_key_without_alias(PrivateKey.generate())
+        tx = account_create_tx
 
         with pytest.raises(ReceiptStatusError) as e:
             tx.execute(client, validate_status=True)
@@ -127,7 +141,7 @@ def test_execute_raises_error_when_validation_enabled_and_transaction_fails():
         assert e.value.status == ResponseCode.INVALID_SIGNATURE
 
 
-def test_execute_returns_receipt_without_error_when_validation_disabled():
+def test_execute_returns_receipt_without_error_when_validation_disabled(account_create_tx):
     """Test execute returns a receipt normally on failure when validate_status is False."""
     ok_response = transaction_response_pb2.TransactionResponse(nodeTransactionPrecheckCode=ResponseCode.OK)
 
@@ -141,7 +155,7 @@ def test_execute_returns_receipt_without_error_when_validation_disabled():
     response_sequence = [[ok_response, receipt_response]]
 
     with mock_hedera_servers(response_sequence) as client:
-        tx = AccountCreateTransaction().set_initial_balance(1).set_key_without_alias(PrivateKey.generate())
+        tx = account_create_tx
 
         receipt = tx.execute(client)
 
@@ -164,6 +178,22 @@ def test_duplicate_signature_not_added():
     assert len(sig_pairs) == 1, "Expected 1 signature for duplicate key"
 
 
+def test_resign_with_same_key_skips_signing():
+    tx = TokenMintTransaction()
+    tx.set_transaction_id(TransactionId.generate(AccountId(0, 0, 1234)))
+    tx.set_node_account_ids([AccountId(0, 0, 3), AccountId(0, 0, 4)])
+    tx.set_token_id(TokenId(0, 0, 1))
+    tx.set_amount(100)
+    key = PrivateKey.generate_ed25519()
+    tx.freeze()
+    tx.sign(key)
+
+    with patch.object(PrivateKey, "sign", side_effect=AssertionError("should not re-sign")):
+        tx.sign(key)
+
+    assert all(len(sig_map.sigPair) == 1 for sig_map in tx._signature_map.values())
+
+
 def test_multiple_keys_still_work():
     tx = TokenMintTransaction()
     tx.set_transaction_id(TransactionId.generate(AccountId(0, 0, 1234)))
@@ -553,3 +583,15 @@ def test_transaction_default_max_fee(account_id):
 
     assert tx_body is not None
     assert tx_body.transactionFee == Hbar(2).to_tinybars()
+
+
+def test_get_transaction_class_is_cached():
+    """Test repeated transaction class lookups are served from the cache."""
+    from hiero_sdk_python.transaction.transfer_transaction import TransferTransaction
+
+    Transaction._get_transaction_class.cache_clear()
+
+    assert Transaction._get_transaction_class("cryptoTransfer") is TransferTransaction
+    assert Transaction._get_transaction_class("cryptoTransfer") is TransferTransaction
+    assert Transaction._get_transaction_class.cache_info().hits == 1
+    assert Transaction._get_transaction_class("cryptoAddLiveHash") is None